@@ -9,6 +9,11 @@ SCREEN_HEIGHT = 600
 FPS = 60
 TILE_SIZE = 50
 
+# Simulation Timing
+FIXED_TIMESTEP = True  # Step gameplay at SIMULATION_HZ, render in between
+SIMULATION_HZ = 120
+MAX_FRAME_TIME = 0.25  # Longest frame (seconds) fed to the accumulator, extra time is dropped
+
 # Physics
 GRAVITY = 1
 MAX_FALL_SPEED = 50
@@ -30,6 +35,9 @@ METEORITE_SIZE = TILE_SIZE
 METEORITE_HITBOX_WIDTH = 30
 METEORITE_HITBOX_HEIGHT = 30
 METEORITE_BASE_VELOCITY = -8
+METEORITE_ROTATION_STEPS = 64  # Pre-rotated frames per rock (more = smoother, more memory)
+METEORITE_FIELD_CAPACITY = 256  # Initial slots in the meteorite arrays, doubles when full
+SPAWN_PRECOMPUTE_HORIZON = 600.0  # Seconds of spawn times a headless run generates up front
 
 # Animation
 WALK_ANIMATION_COOLDOWN = 8
@@ -37,6 +45,8 @@ IDLE_ANIMATION_FRAMES = 4
 WALK_ANIMATION_FRAMES = 10
 
 # Difficulty Presets
+MIN_SPAWN_RATE = 5  # spawn_rate never drops below this (one in N frames at 60 FPS)
+MAX_METEORITE_FALL_SPEED = -20  # fall_speed never goes beyond this
 DIFFICULTY_EASY = {
     'spawn_rate': 60,
     'fall_speed': -6,
@@ -94,6 +104,7 @@ SKY_IMAGE = os.path.join(IMG_DIR, 'sky.png')
 SUN_IMAGE = os.path.join(IMG_DIR, 'sun.png')
 DIRT_IMAGE = os.path.join(IMG_DIR, 'dirt.png')
 GRASS_IMAGE = os.path.join(IMG_DIR, 'grass.png')
+SUN_POSITION = (100, 100)
 
 # Audio files
 MUSIC_FILE = os.path.join(AUDIO_DIR, 'music', 'background.ogg')
@@ -110,6 +121,32 @@ BUTTON_PADDING = 20
 MENU_TITLE_SIZE = 48
 MENU_TEXT_SIZE = 24
 HUD_TEXT_SIZE = 24
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by FontManager
 
 # Countdown
 COUNTDOWN_DURATION = 3  # seconds
+
+# Death animation
+DEATH_ANIMATION_DURATION = 3.0  # seconds, ragdoll may finish earlier
+RAGDOLL_COUNT = 1  # Bodies thrown on death
+RAGDOLL_MAX_COUNT = 512  # Hard cap on bodies in one ragdoll system
+RAGDOLL_ROTATION_STEPS = 72  # Pre-rotated frames per limb (5 degree steps)
+
+# Effects
+PARTICLE_CAPACITY = 4096  # Particle slots allocated up front
+PARTICLE_BUDGET = 2048  # Live particles allowed, new ones evict the oldest lower-priority ones
+PARTICLE_FRAME_BUDGET = 0.75 / FPS  # Frame work time (seconds) above which trails are thinned
+PARTICLE_MIN_TRAIL_DENSITY = 0.1  # Fraction of trail particles kept under heaviest load
+PARTICLE_COLOR_STEP = 16  # Particle sprites are shared per color bucket of this width
+PARTICLE_ALPHA_LEVELS = 16  # Fade-out steps per particle sprite
+GLOW_ALPHA_LEVELS = 32  # Prebuilt power-up glow surfaces over the pulse
+
+# Rendering
+DIRTY_RECT_RENDERING = False  # Only redraw and present areas that changed
+DIRTY_RECT_MERGE_LIMIT = 64  # Above this many rects, present their bounding box instead
+
+# Profiler
+PROFILER_WINDOW = 300  # Frames kept for rolling percentiles
+PROFILER_REFRESH_FRAMES = 15  # Overlay statistics refresh interval
+PROFILER_TEXT_SIZE = 16
+PROFILER_FONT = 'couriernew,dejavusansmono,monospace'
@@ -39,6 +39,8 @@ class AssetLoader:
     _images: Dict[str, pygame.Surface] = {}
     _sounds: Dict[str, pygame.mixer.Sound] = {}
     _sprite_sheets: Dict[str, List[pygame.Surface]] = {}
+    _rotations: Dict[tuple, List[pygame.Surface]] = {}
+    _variants: Dict[tuple, pygame.Surface] = {}
 
     def __new__(cls):
         if cls._instance is None:
@@ -65,7 +67,11 @@ class AssetLoader:
             if not os.path.exists(path):
                 raise FileNotFoundError(f"Image not found: {path}")
 
-            image = pygame.image.load(path).convert_alpha()
+            image = pygame.image.load(path)
+
+            # Pixel format conversion needs a display; headless runs keep the raw surface
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
 
             if scale:
                 image = pygame.transform.scale(image, scale)
@@ -108,6 +114,77 @@ class AssetLoader:
             print(f"ERROR: Failed to load sprite sheet {path}: {e}")
             return []
 
+    def load_rotation_frames(self, path: str, scale: Optional[tuple] = None,
+                             steps: int = C.METEORITE_ROTATION_STEPS) -> List[pygame.Surface]:
+        """
+        Load an image pre-rotated at evenly spaced angles.
+
+        Frame i is the image rotated by i * 360 / steps degrees, so drawing at
+        any angle becomes an index lookup instead of a per-frame rotate.
+
+        Args:
+            path: Path to the image file
+            scale: Optional (width, height) tuple to scale the image before rotating
+            steps: Number of frames over a full turn
+
+        Returns:
+            List of rotated surfaces
+        """
+        cache_key = (path, scale, steps)
+
+        if cache_key in self._rotations:
+            return self._rotations[cache_key]
+
+        image = self.load_image(path, scale)
+        frames = [pygame.transform.rotate(image, i * 360.0 / steps) for i in range(steps)]
+        self._rotations[cache_key] = frames
+        return frames
+
+    def load_variant(self, path: str, scale: Optional[tuple] = None, flip_x: bool = False,
+                     flip_y: bool = False, tint: Optional[tuple] = None,
+                     frame: Optional[tuple] = None) -> pygame.Surface:
+        """
+        Load a derived (scaled, flipped and/or tinted) version of an image or sprite sheet frame.
+
+        Variants are cached on source and transform, and built from the cached
+        unflipped, untinted variant, so each transform runs once per process.
+
+        Args:
+            path: Path to the image or sprite sheet file
+            scale: Optional (width, height) tuple to scale to
+            flip_x: If True, mirror horizontally
+            flip_y: If True, mirror vertically
+            tint: Optional RGB(A) color multiplied into the pixels
+            frame: Optional (frame_width, frame_height, index) selecting one sprite sheet frame
+
+        Returns:
+            Derived surface (shared - blit it, don't draw on it)
+        """
+        cache_key = (path, frame, scale, flip_x, flip_y, tint)
+
+        if cache_key in self._variants:
+            return self._variants[cache_key]
+
+        if flip_x or flip_y or tint:
+            image = self.load_variant(path, scale, frame=frame)
+            if flip_x or flip_y:
+                image = pygame.transform.flip(image, flip_x, flip_y)
+            if tint:
+                image = image.copy()
+                image.fill(tint, special_flags=pygame.BLEND_RGBA_MULT if len(tint) == 4
+                           else pygame.BLEND_RGB_MULT)
+        else:
+            if frame:
+                frame_width, frame_height, index = frame
+                image = self.load_sprite_sheet(path, frame_width, frame_height)[index]
+            else:
+                image = self.load_image(path)
+            if scale and image.get_size() != scale:
+                image = pygame.transform.scale(image, scale)
+
+        self._variants[cache_key] = image
+        return image
+
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
         """
         Load sound with caching and error handling.
@@ -145,12 +222,16 @@ class AssetLoader:
         self.load_image(C.GRASS_IMAGE, (C.TILE_SIZE, C.TILE_SIZE))
 
         # Sprite sheets
-        self.load_sprite_sheet(C.PLAYER_SPRITE_SHEET, 24, 23)
+        player_frames = self.load_sprite_sheet(C.PLAYER_SPRITE_SHEET, 24, 23)
+        for i in range(min(len(player_frames), C.IDLE_ANIMATION_FRAMES + C.WALK_ANIMATION_FRAMES)):
+            for flip_x in (False, True):
+                self.load_variant(C.PLAYER_SPRITE_SHEET, (C.PLAYER_SIZE, C.PLAYER_SIZE),
+                                  flip_x, frame=(24, 23, i))
 
-        # Rocks
+        # Rocks (with their rotation frames)
         for i in range(1, 3):
             rock_path = os.path.join(C.ROCKS_DIR, f'rock{i}.png')
-            self.load_image(rock_path, (C.METEORITE_SIZE, C.METEORITE_SIZE))
+            self.load_rotation_frames(rock_path, (C.METEORITE_SIZE, C.METEORITE_SIZE))
 
         # Create directories if they don't exist
         os.makedirs(C.POWERUPS_DIR, exist_ok=True)
@@ -170,3 +251,5 @@ class AssetLoader:
         self._images.clear()
         self._sounds.clear()
         self._sprite_sheets.clear()
+        self._rotations.clear()
+        self._variants.clear()
@@ -0,0 +1,72 @@
+"""
+Pre-composited static background layers (sky, sun, tilemap).
+"""
+import pygame
+from typing import Dict, Optional, Tuple
+from ..config import constants as C
+from .asset_loader import AssetLoader
+
+
+class BackgroundCache:
+    """Builds opaque background surfaces once and reuses them every frame."""
+
+    def __init__(self, world):
+        """
+        Initialize cache.
+
+        Args:
+            world: World whose tiles are baked into the game background
+        """
+        self.world = world
+        self.asset_loader = AssetLoader()
+        self._layers: Dict[bool, pygame.Surface] = {}
+        self._key: Optional[Tuple] = None
+        self.rebuilds = 0
+
+    def get(self, size: Tuple[int, int], with_world: bool = True) -> pygame.Surface:
+        """
+        Get the background for a screen size, rebuilding only if the world or size changed.
+
+        Args:
+            size: Screen (width, height)
+            with_world: If True, include the tilemap (gameplay); otherwise sky and sun only (menus)
+
+        Returns:
+            Opaque surface the size of the screen
+        """
+        key = (tuple(size), self.world.version)
+        if key != self._key:
+            self._layers.clear()
+            self._key = key
+
+        layer = self._layers.get(with_world)
+        if layer is None:
+            layer = self._build(tuple(size), with_world)
+            self._layers[with_world] = layer
+        return layer
+
+    def invalidate(self):
+        """Drop all cached layers."""
+        self._layers.clear()
+        self._key = None
+
+    def _build(self, size: Tuple[int, int], with_world: bool) -> pygame.Surface:
+        """Composite one layer."""
+        self.rebuilds += 1
+
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+
+        # The sky is drawn unscaled from the top left, like the original scene, and
+        # only stretched if the screen is larger than the image
+        sky = self.asset_loader.load_image(C.SKY_IMAGE)
+        if sky.get_width() < size[0] or sky.get_height() < size[1]:
+            sky = pygame.transform.scale(sky, (max(sky.get_width(), size[0]), max(sky.get_height(), size[1])))
+        surface.blit(sky, (0, 0))
+        surface.blit(self.asset_loader.load_image(C.SUN_IMAGE), C.SUN_POSITION)
+
+        if with_world:
+            self.world.draw(surface)
+
+        return surface
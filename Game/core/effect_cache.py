@@ -0,0 +1,143 @@
+"""
+Prebuilt surfaces for procedural effects (shield bubble, power-up glow, particles, limbs).
+"""
+import pygame
+from typing import Dict, List, Tuple
+from ..config import constants as C
+
+
+class EffectCache:
+    """Singleton cache of effect sprites, built on first use and reused every frame."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._bubbles: Dict[tuple, pygame.Surface] = {}
+        self._glows: Dict[tuple, List[pygame.Surface]] = {}
+        self._discs: Dict[tuple, pygame.Surface] = {}
+        self._rotations: Dict[tuple, List[pygame.Surface]] = {}
+
+    def shield_bubble(self, radius: int, color: Tuple[int, int, int, int] = (100, 200, 255, 100)) -> pygame.Surface:
+        """
+        Get a translucent filled circle.
+
+        Args:
+            radius: Circle radius
+            color: RGBA fill color
+
+        Returns:
+            Surface of size (2 * radius, 2 * radius)
+        """
+        key = (radius, color)
+        surface = self._bubbles.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            self._bubbles[key] = surface
+        return surface
+
+    def glow(self, pulse: float, size: int = 60, radius: int = 25,
+             color: Tuple[int, int, int] = (255, 255, 0), low: int = 50, high: int = 150,
+             levels: int = C.GLOW_ALPHA_LEVELS) -> pygame.Surface:
+        """
+        Get a pulsing glow, quantized to one of a fixed table of alpha levels.
+
+        Args:
+            pulse: Pulse position from -1 (dimmest) to 1 (brightest)
+            size: Surface width and height
+            radius: Glow circle radius
+            color: RGB glow color
+            low: Alpha at pulse -1
+            high: Alpha at pulse 1
+            levels: Number of prebuilt alpha levels
+
+        Returns:
+            Glow surface (shared - blit it, don't draw on it)
+        """
+        key = (size, radius, color, low, high, levels)
+        frames = self._glows.get(key)
+        if frames is None:
+            frames = []
+            for level in range(levels):
+                alpha = round(low + (high - low) * level / max(1, levels - 1))
+                surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(surface, (*color, max(0, min(255, alpha))), (size // 2, size // 2), radius)
+                frames.append(surface)
+            self._glows[key] = frames
+
+        level = round((max(-1.0, min(1.0, pulse)) + 1) * 0.5 * (levels - 1))
+        return frames[level]
+
+    def particle_disc(self, size: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """
+        Get a particle sprite. Callers bucket color and alpha so the bank stays small.
+
+        Args:
+            size: Disc radius
+            color: RGB color
+            alpha: Opacity 0-255
+
+        Returns:
+            Surface of size (2 * size, 2 * size)
+        """
+        key = (size, color, alpha)
+        surface = self._discs.get(key)
+        if surface is None:
+            surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (*color, alpha), (size, size), size)
+            self._discs[key] = surface
+        return surface
+
+    def rotated_rects(self, width: int, height: int, color: Tuple[int, int, int],
+                      steps: int = C.RAGDOLL_ROTATION_STEPS) -> List[pygame.Surface]:
+        """
+        Get a filled rectangle pre-rotated at evenly spaced angles.
+
+        Args:
+            width: Rectangle width
+            height: Rectangle height
+            color: RGB fill color
+            steps: Number of frames over a full turn
+
+        Returns:
+            List where frame i is rotated by i * 360 / steps degrees
+        """
+        key = (width, height, color, steps)
+        frames = self._rotations.get(key)
+        if frames is None:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill(color)
+            frames = [pygame.transform.rotate(surface, i * 360.0 / steps) for i in range(steps)]
+            self._rotations[key] = frames
+        return frames
+
+    def stats(self) -> dict:
+        """
+        Get cache sizes.
+
+        Returns:
+            Dictionary with bubble, glow table, particle sprite and rotation set counts
+        """
+        return {
+            'bubbles': len(self._bubbles),
+            'glows': len(self._glows),
+            'particle_sprites': len(self._discs),
+            'rotation_sets': len(self._rotations)
+        }
+
+    def clear_cache(self):
+        """Drop all prebuilt surfaces (useful for testing)."""
+        self._bubbles.clear()
+        self._glows.clear()
+        self._discs.clear()
+        self._rotations.clear()
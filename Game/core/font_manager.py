@@ -0,0 +1,104 @@
+"""
+Central font registry with an LRU cache of rendered text surfaces.
+"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from ..config import constants as C
+
+
+class FontManager:
+    """Singleton font registry and rendered-text cache."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._text: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self.max_entries = C.TEXT_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """
+        Get a font, looking it up on the system only the first time.
+
+        Args:
+            size: Font size
+            name: System font name(s), default font if not provided
+
+        Returns:
+            Font object
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text: str, size: int, color: tuple, antialias: bool = True,
+               name: Optional[str] = None) -> pygame.Surface:
+        """
+        Render text, reusing the surface if the same string was rendered recently.
+
+        The returned surface is shared - blit it, don't draw on it.
+
+        Args:
+            text: Text to render
+            size: Font size
+            color: RGB color tuple
+            antialias: If True, render with antialiasing
+            name: System font name(s), default font if not provided
+
+        Returns:
+            Rendered text surface
+        """
+        key = (name, size, text, tuple(color), antialias)
+        surface = self._text.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._text.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(size, name).render(text, antialias, color)
+        self._text[key] = surface
+        if len(self._text) > self.max_entries:
+            self._text.popitem(last=False)
+        return surface
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with font count, cached text count, hits, misses and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'fonts': len(self._fonts),
+            'entries': len(self._text),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear_cache(self):
+        """Clear cached fonts and text (useful for testing)."""
+        self._fonts.clear()
+        self._text.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,5 +1,5 @@
 """
-Main game engine with delta time support.
+Main game engine with delta time and fixed timestep support.
 """
 import pygame
 from ..config import constants as C
@@ -8,7 +8,13 @@ from ..config import constants as C
 class GameEngine:
     """Core game engine managing the main loop."""
 
-    def __init__(self):
+    def __init__(self, fixed_timestep: bool = C.FIXED_TIMESTEP):
+        """
+        Initialize engine and open the window.
+
+        Args:
+            fixed_timestep: If True, gameplay runs in fixed steps of 1 / SIMULATION_HZ
+        """
         pygame.init()
         pygame.display.set_caption("Dodge Game 2D")
 
@@ -17,11 +23,39 @@ class GameEngine:
         self.delta_time = 0.0  # seconds since last frame
         self.running = True
 
+        # Fixed timestep accumulator
+        self.fixed_timestep = fixed_timestep
+        self.fixed_dt = 1.0 / C.SIMULATION_HZ
+        self.accumulator = 0.0
+        self.interpolation_alpha = 1.0  # Render blend between previous and current step
+
     def update(self):
         """Update delta time - call once per frame."""
-        # Convert milliseconds to seconds and cap at 0.05 (20 FPS minimum)
         dt_ms = self.clock.tick(C.FPS)
-        self.delta_time = min(dt_ms / 1000.0, 0.05)
+
+        if self.fixed_timestep:
+            # Long stalls are dropped instead of simulated (avoids spiral of death)
+            self.delta_time = min(dt_ms / 1000.0, C.MAX_FRAME_TIME)
+            self.accumulator += self.delta_time
+        else:
+            # Convert milliseconds to seconds and cap at 0.05 (20 FPS minimum)
+            self.delta_time = min(dt_ms / 1000.0, 0.05)
+
+    def consume_fixed_steps(self) -> int:
+        """
+        Drain the accumulator into whole simulation steps.
+
+        Returns:
+            Number of fixed steps to run this frame (0 in variable timestep mode)
+        """
+        if not self.fixed_timestep:
+            self.interpolation_alpha = 1.0
+            return 0
+
+        steps = int(self.accumulator / self.fixed_dt)
+        self.accumulator -= steps * self.fixed_dt
+        self.interpolation_alpha = self.accumulator / self.fixed_dt
+        return steps
 
     def get_delta_time(self) -> float:
         """
@@ -0,0 +1,93 @@
+"""
+Dirty-rectangle renderer - restores and presents only changed screen regions.
+"""
+import pygame
+from typing import Iterable, List, Optional, Union
+from ..config import constants as C
+
+
+class DirtyRectRenderer:
+    """
+    Tracks the screen areas drawn each frame.
+
+    In dirty mode, each frame erases last frame's areas from the background and
+    pushes only old + new areas to the display. In full mode it behaves like a
+    regular background blit + flip.
+    """
+
+    def __init__(self, screen: pygame.Surface, background: Optional[pygame.Surface] = None,
+                 enabled: bool = C.DIRTY_RECT_RENDERING):
+        """
+        Initialize renderer.
+
+        Args:
+            screen: Display surface
+            background: Opaque surface restored under moving sprites
+            enabled: If True, use dirty rectangles instead of full-screen flips
+        """
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.screen_rect = screen.get_rect()
+
+        self._dirty: List[pygame.Rect] = []
+        self._previous: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    def set_background(self, background: pygame.Surface):
+        """
+        Swap the background and force a full redraw.
+
+        Args:
+            background: New opaque background surface
+        """
+        if background is not self.background:
+            self.background = background
+            self.invalidate()
+
+    def invalidate(self):
+        """Redraw and present the whole screen next frame."""
+        self._full_redraw = True
+
+    def begin_frame(self):
+        """Erase the previous frame's sprites (or the whole screen)."""
+        self._dirty = []
+
+        if self._full_redraw or not self.enabled:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self._previous:
+                self.screen.blit(self.background, rect, rect)
+
+    def mark(self, rects: Union[pygame.Rect, Iterable[pygame.Rect], None]):
+        """
+        Record screen areas drawn this frame.
+
+        Args:
+            rects: A rect, an iterable of rects, or None
+        """
+        if not self.enabled or rects is None:
+            return
+
+        if isinstance(rects, pygame.Rect):
+            rects = (rects,)
+
+        for rect in rects:
+            if rect:
+                clipped = rect.clip(self.screen_rect)
+                if clipped.width and clipped.height:
+                    self._dirty.append(clipped)
+
+    def present(self):
+        """Push this frame to the display."""
+        if self._full_redraw or not self.enabled:
+            pygame.display.flip()
+        else:
+            update = self._previous + self._dirty
+            # Many small rects cost more in SDL than one bounding box
+            if len(update) > C.DIRTY_RECT_MERGE_LIMIT:
+                update = [update[0].unionall(update[1:])]
+            pygame.display.update(update)
+
+        self._previous = self._dirty
+        self._full_redraw = False
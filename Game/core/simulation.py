@@ -0,0 +1,262 @@
+"""
+Headless gameplay simulation - no window, font or mixer required.
+"""
+import numpy as np
+from contextlib import nullcontext
+from enum import Enum, auto
+from typing import List, Optional, Tuple
+from ..config import constants as C
+from .random_streams import RandomStreams
+from ..entities.player import Player, PlayerInput
+from ..entities.meteorite import MeteoriteField
+from ..entities.world import World
+from ..entities.powerup import PowerUpManager, PowerUpType
+from ..systems.score_manager import ScoreManager
+from ..systems.difficulty_manager import DifficultyManager
+from ..systems.effect_scheduler import EffectScheduler
+
+
+# HUD label and duration (seconds of game time) per power-up
+POWERUP_LABELS = {
+    PowerUpType.SHIELD: "Shield Active",
+    PowerUpType.SLOW_MOTION: "Slow Motion",
+    PowerUpType.SCORE_MULTIPLIER: "Score x2"
+}
+POWERUP_DURATIONS = {
+    PowerUpType.SHIELD: C.SHIELD_DURATION / 1000.0,
+    PowerUpType.SLOW_MOTION: C.SLOWMO_DURATION / 1000.0,
+    PowerUpType.SCORE_MULTIPLIER: C.MULTIPLIER_DURATION / 1000.0
+}
+
+
+class SimEvent(Enum):
+    """Gameplay events reported by a simulation step."""
+    JUMP = auto()
+    SHIELD_HIT = auto()
+    POWERUP_COLLECTED = auto()
+    PLAYER_KILLED = auto()
+
+
+class Simulation:
+    """Steps player, meteorites, power-ups, difficulty and score from explicit input."""
+
+    def __init__(self, difficulty: str = 'medium', world_data: list = None,
+                 score_manager: Optional[ScoreManager] = None, profiler=None,
+                 time_scale: float = 1.0, seed: Optional[int] = None, start_time: float = 0.0):
+        """
+        Initialize simulation.
+
+        Args:
+            difficulty: 'easy', 'medium', or 'hard'
+            world_data: World tile data, uses the default level if not provided
+            score_manager: Score manager to update, creates one if not provided
+            profiler: Optional FrameProfiler timing each subsystem
+            time_scale: Fixed steps per step() call (e.g. 10 to fast-forward)
+            seed: Seed for every run of this simulation, a fresh one per run if not provided
+            start_time: Game time to start at (difficulty curve position)
+        """
+        self.profiler = profiler
+        self.seed = seed
+        self.time_scale = time_scale  # Fixed steps per step() call, for fast-forward
+        self.hazard_scale = 1.0  # Extra scale on meteorites (slow motion)
+        self.world_data = world_data if world_data is not None else World.get_default_world_data()
+        self.score_manager = score_manager or ScoreManager()
+        self.powerup_manager = PowerUpManager()
+        self.meteorites = MeteoriteField()
+
+        self.effects = EffectScheduler()
+        self.effects.register(PowerUpType.SHIELD, self._start_shield, self._end_shield)
+        self.effects.register(PowerUpType.SLOW_MOTION, self._start_slowmo, self._end_slowmo)
+        self.effects.register(PowerUpType.SCORE_MULTIPLIER,
+                              self._start_multiplier, self._end_multiplier)
+
+        self.reset(difficulty, start_time)
+
+    def reset(self, difficulty: str, start_time: float = 0.0):
+        """
+        Start a new run.
+
+        Args:
+            difficulty: 'easy', 'medium', or 'hard'
+            start_time: Game time to start at, e.g. to benchmark late-game load without warming up
+        """
+        # Same seed and inputs give the same run
+        self.rng = RandomStreams(self.seed)
+        self.meteorites.rng = self.rng.python('spawn_layout')
+        self.powerup_manager.rng = self.rng.python('powerups')
+
+        self.score_manager.reset()
+        self.difficulty_manager = DifficultyManager(difficulty, self.rng.python('spawn_timing'),
+                                                    start_time)
+        self.powerup_manager.clear()
+        self.player = Player(100, C.GROUND_LEVEL)
+        self.meteorites.clear()
+        self.effects.clear()
+        self.hazard_scale = 1.0
+        self._backlog = 0.0  # Scaled steps owed but not run yet
+        self.time = start_time
+        self.ticks = 0
+        self.game_over = False
+
+    def step(self, dt: float, inputs: PlayerInput) -> List[Tuple[SimEvent, tuple]]:
+        """
+        Advance the simulation by time_scale fixed steps of dt.
+
+        The step size never changes with the time scale, so a fast-forwarded
+        run plays out exactly like a real-time one. Fractional scales carry
+        the remainder over to the next call.
+
+        Args:
+            dt: Delta time of one fixed step in seconds
+            inputs: Player controls, held for every step of this call
+
+        Returns:
+            List of (event, data) tuples raised during the steps
+        """
+        events = []
+        self._backlog += self.time_scale
+        while self._backlog >= 1.0 - 1e-9 and not self.game_over:
+            self._backlog -= 1.0
+            self._tick(dt, inputs, events)
+        return events
+
+    def _tick(self, dt: float, inputs: PlayerInput, events: list):
+        """
+        Advance the simulation by one fixed step.
+
+        Args:
+            dt: Delta time in seconds
+            inputs: Player controls for this step
+            events: Event list to append to
+        """
+        self.time += dt
+        self.ticks += 1
+
+        # Update systems
+        with self._section('sim.difficulty'):
+            self.difficulty_manager.update(dt)
+        with self._section('sim.effects'):
+            self.effects.update(self.time)
+        with self._section('sim.score'):
+            self.score_manager.update(dt)
+
+        # Update player
+        was_grounded = self.player.grounded
+        with self._section('sim.player'):
+            self.player.update(dt, inputs)
+
+        if was_grounded and not self.player.grounded:
+            events.append((SimEvent.JUMP, (self.player.rect.x, self.player.rect.y)))
+
+        with self._section('sim.meteorites'):
+            killed = self._update_meteorites(dt, events)
+        if killed:
+            return
+
+        # Update power-ups
+        with self._section('sim.powerups'):
+            self.powerup_manager.update(dt, self.world_data)
+            for powerup_type in self.powerup_manager.check_collisions(self.player.hitbox):
+                self._apply_powerup(powerup_type)
+                events.append((SimEvent.POWERUP_COLLECTED,
+                               (self.player.rect.centerx, self.player.rect.centery, powerup_type)))
+
+    def _update_meteorites(self, dt: float, events: list) -> bool:
+        """
+        Spawn, move and collide meteorites.
+
+        Args:
+            dt: Delta time in seconds
+            events: Event list to append to
+
+        Returns:
+            True if the player was killed
+        """
+        # Spawn meteorites
+        field = self.meteorites
+        for _ in range(self.difficulty_manager.meteorites_due(self.time)):
+            field.spawn(self.world_data, self.difficulty_manager.get_meteorite_speed())
+
+        field.update(dt * self.hazard_scale)
+
+        # Collisions
+        player = self.player
+        hits = field.collide(player.hitbox, player.prev_hitbox)
+        if hits.size:
+            if not player.has_shield:
+                self.game_over = True
+                events.append((SimEvent.PLAYER_KILLED, (player.rect.x, player.rect.y)))
+                return True
+
+            # Shield absorbs one hit, a second rock in the same step still kills
+            self.effects.cancel(PowerUpType.SHIELD)
+            absorbed = hits[0]
+            events.append((SimEvent.SHIELD_HIT, (int(field.x[absorbed]), int(field.y[absorbed]))))
+            if hits.size > 1:
+                self.game_over = True
+                events.append((SimEvent.PLAYER_KILLED, (player.rect.x, player.rect.y)))
+                return True
+            hits = hits[:1]
+
+        # Landed meteorites count as dodged
+        landed = field.grounded_indices()
+        for _ in range(landed.size):
+            self.score_manager.add_meteorite_dodge()
+
+        if hits.size or landed.size:
+            field.release(np.concatenate((hits, landed)))
+        return False
+
+    def _section(self, name: str):
+        """Profile a block if a profiler is attached."""
+        return self.profiler.section(name) if self.profiler else nullcontext()
+
+    @property
+    def active_powerups(self) -> List[str]:
+        """HUD labels of running power-ups, in activation order."""
+        return [POWERUP_LABELS[effect] for effect in self.effects.active()]
+
+    def _apply_powerup(self, powerup_type: PowerUpType):
+        """Apply collected power-up, or extend it if already running."""
+        self.effects.activate(powerup_type, self.time, POWERUP_DURATIONS[powerup_type])
+
+    def _start_shield(self):
+        self.player.has_shield = True
+
+    def _end_shield(self):
+        self.player.has_shield = False
+
+    def _start_slowmo(self):
+        # Meteorites run on a slower clock, including ones spawned while it lasts
+        self.hazard_scale = C.SLOWMO_FACTOR
+
+    def _end_slowmo(self):
+        self.hazard_scale = 1.0
+
+    def _start_multiplier(self):
+        self.score_manager.set_multiplier(C.SCORE_MULTIPLIER)
+
+    def _end_multiplier(self):
+        self.score_manager.set_multiplier(1.0)
+
+    def run(self, ticks: int, dt: float = 1.0 / C.SIMULATION_HZ, policy=None) -> int:
+        """
+        Run many ticks back to back, stopping early on game over.
+
+        Args:
+            ticks: Maximum number of ticks to run
+            dt: Delta time of one fixed step in seconds
+            policy: Callable taking the simulation and returning a PlayerInput,
+                    the player stands still if not provided
+
+        Returns:
+            Number of ticks actually run
+        """
+        idle = PlayerInput()
+        horizon = min(ticks * dt * self.time_scale, C.SPAWN_PRECOMPUTE_HORIZON)
+        self.difficulty_manager.spawner.precompute(self.time + horizon)
+        for tick in range(ticks):
+            if self.game_over:
+                return tick
+            self.step(dt, policy(self) if policy else idle)
+        return ticks
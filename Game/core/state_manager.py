@@ -13,6 +13,7 @@ class GameState(Enum):
     COUNTDOWN = auto()
     PLAYING = auto()
     PAUSED = auto()
+    DYING = auto()
     GAME_OVER = auto()
 
 
@@ -1,116 +1,336 @@
 """
-Meteorite entity with proper collision detection.
+Meteorite field - all falling meteorites stored as NumPy arrays.
 """
 import pygame
 import random
 import os
+import numpy as np
+from typing import List, Optional, Tuple
 from ..config import constants as C
 from ..core.asset_loader import AssetLoader
+from ..systems.broadphase import ColumnGrid
 
 
-class Meteorite:
-    """Falling meteorite obstacle."""
+ROCK_PATHS = [os.path.join(C.ROCKS_DIR, f'rock{i}.png') for i in range(1, 3)]
 
-    def __init__(self, world_data: list, velocity: float = None):
+# Per-slot arrays, grown together
+_FIELDS = (
+    ('x', np.float64),          # Left edge of the sprite
+    ('y', np.float64),          # Top edge of the sprite
+    ('prev_y', np.float64),     # Top edge at previous step, for interpolation
+    ('velocity', np.float64),   # Fall speed (negative number)
+    ('rotation', np.float64),
+    ('rotation_speed', np.float64),
+    ('half_w', np.float64),     # Hitbox half extents, hitbox is centered on the sprite
+    ('half_h', np.float64),
+    ('rock', np.int8),          # Index into the rock images
+    ('grounded', np.bool_),
+)
+
+
+def _slab(start: np.ndarray, move, extent: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parametric interval where a moving point is strictly inside (-extent, extent) on one axis.
+
+    Args:
+        start: Point coordinate at t=0
+        move: Displacement over the step (scalar or array)
+        extent: Half width of the slab
+
+    Returns:
+        Tuple of (t_enter, t_exit) arrays; empty intervals have t_enter >= t_exit
+    """
+    move = np.broadcast_to(np.asarray(move, dtype=np.float64), start.shape)
+    still = move == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t1 = (-extent - start) / move
+        t2 = (extent - start) / move
+    inside = np.abs(start) < extent
+    enter = np.where(still, np.where(inside, -np.inf, np.inf), np.minimum(t1, t2))
+    leave = np.where(still, np.where(inside, np.inf, -np.inf), np.maximum(t1, t2))
+    return enter, leave
+
+
+class MeteoriteField:
+    """
+    Structure-of-arrays store for falling meteorites.
+
+    Slots [0, count) are live. Integration, grounding and collision tests run
+    as single vectorised operations; dead slots are filled by moving the last
+    live slots into them, so the live range stays packed.
+    """
+
+    def __init__(self, capacity: int = C.METEORITE_FIELD_CAPACITY, rng: random.Random = None):
         """
-        Initialize meteorite.
+        Initialize an empty field.
+
+        Args:
+            capacity: Initial number of slots (grows by doubling when full)
+            rng: Random source for spawn layout, the global random module if not provided
+        """
+        self.rng = rng or random
+        self.capacity = 0
+        self.count = 0
+        self._allocate(max(1, capacity))
+
+        self._rock_frames: List[List[pygame.Surface]] = []
+
+        # Broadphase: slot indices bucketed by hitbox column (meteorites never change column)
+        self.grid = ColumnGrid()
+        self.last_candidates = 0
+
+        # Statistics
+        self.spawned = 0
+        self.released = 0
+        self.peak = 0
+        self.grows = 0
+
+    def _allocate(self, capacity: int):
+        """Resize every per-slot array, keeping live data."""
+        for name, dtype in _FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def _load_frames(self):
+        """Resolve the pre-rotated rock frames once."""
+        asset_loader = AssetLoader()
+        self._rock_frames = [
+            asset_loader.load_rotation_frames(path, (C.METEORITE_SIZE, C.METEORITE_SIZE))
+            for path in ROCK_PATHS
+        ]
+
+    def spawn(self, world_data: list, velocity: float = None) -> int:
+        """
+        Add a meteorite above the screen at a random tile column.
 
         Args:
             world_data: World tile data to determine spawn range
             velocity: Fall speed (negative number), uses base if not provided
+
+        Returns:
+            Slot index of the new meteorite
         """
-        self.asset_loader = AssetLoader()
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+            self.grows += 1
 
         # FIXED: Proper spawn position calculation (0-based index)
         max_tiles = len(world_data[0])
-        spawn_tile = random.randint(0, max_tiles - 1)  # FIXED: was random.randint(1, max_tiles)
-        self.pos = pygame.math.Vector2(
-            spawn_tile * C.TILE_SIZE,
-            -C.METEORITE_SIZE  # Start above screen
-        )
-
-        # Load random rock image
-        rock_num = random.randint(1, 2)
-        rock_path = os.path.join(C.ROCKS_DIR, f'rock{rock_num}.png')
-        self.image = self.asset_loader.load_image(rock_path, (C.METEORITE_SIZE, C.METEORITE_SIZE))
-
-        # Visual rect
-        self.rect = pygame.Rect(
-            int(self.pos.x),
-            int(self.pos.y),
-            C.METEORITE_SIZE,
-            C.METEORITE_SIZE
-        )
-
-        # FIXED: Hitbox centered on meteorite
-        hitbox_offset_x = (C.METEORITE_SIZE - C.METEORITE_HITBOX_WIDTH) // 2
-        hitbox_offset_y = (C.METEORITE_SIZE - C.METEORITE_HITBOX_HEIGHT) // 2
-        self.hitbox = pygame.Rect(
-            int(self.pos.x) + hitbox_offset_x,
-            int(self.pos.y) + hitbox_offset_y,
-            C.METEORITE_HITBOX_WIDTH,
-            C.METEORITE_HITBOX_HEIGHT
-        )
-
-        self.velocity = velocity if velocity is not None else C.METEORITE_BASE_VELOCITY
-        self.grounded = False
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.uniform(-5, 5)
+        spawn_tile = self.rng.randint(0, max_tiles - 1)  # FIXED: was random.randint(1, max_tiles)
+
+        i = self.count
+        self.x[i] = spawn_tile * C.TILE_SIZE
+        self.y[i] = self.prev_y[i] = -C.METEORITE_SIZE  # Start above screen
+        self.velocity[i] = velocity if velocity is not None else C.METEORITE_BASE_VELOCITY
+        self.half_w[i] = C.METEORITE_HITBOX_WIDTH / 2
+        self.half_h[i] = C.METEORITE_HITBOX_HEIGHT / 2
+        self.rock[i] = self.rng.randrange(len(ROCK_PATHS))
+        self.grounded[i] = False
+        self.rotation[i] = self.rng.randint(0, 360)
+        self.rotation_speed[i] = self.rng.uniform(-5, 5)
+
+        self.grid.insert(i, self.x[i] + C.METEORITE_SIZE / 2 - self.half_w[i], self.half_w[i] * 2)
+
+        self.count += 1
+        self.spawned += 1
+        self.peak = max(self.peak, self.count)
+        return i
 
     def update(self, dt: float):
         """
-        Update position and rotation.
+        Move and spin every airborne meteorite, grounding those that land.
 
         Args:
             dt: Delta time in seconds
         """
-        if not self.grounded:
-            # Fall (velocity is negative, so subtract to move down)
-            self.pos.y -= self.velocity * dt * 60
+        n = self.count
+        y = self.y[:n]
+        airborne = ~self.grounded[:n]
 
-            # Rotate
-            self.rotation += self.rotation_speed
+        self.prev_y[:n] = y
 
-            # Update rects - FIXED: Update every frame
-            self.rect.x = int(self.pos.x)
-            self.rect.y = int(self.pos.y)
+        # Fall (velocity is negative, so subtract to move down)
+        y -= np.where(airborne, self.velocity[:n] * (dt * 60), 0.0)
+        self.rotation[:n] += np.where(airborne, self.rotation_speed[:n] * (dt * 60), 0.0)
 
-            hitbox_offset_x = (C.METEORITE_SIZE - C.METEORITE_HITBOX_WIDTH) // 2
-            hitbox_offset_y = (C.METEORITE_SIZE - C.METEORITE_HITBOX_HEIGHT) // 2
-            self.hitbox.x = int(self.pos.x) + hitbox_offset_x
-            self.hitbox.y = int(self.pos.y) + hitbox_offset_y
+        # Ground collision
+        landed = airborne & (y >= C.GROUND_LEVEL)
+        y[landed] = C.GROUND_LEVEL
+        self.grounded[:n] |= landed
 
-            # Check ground collision
-            if self.pos.y >= C.GROUND_LEVEL:
-                self.grounded = True
-                self.pos.y = C.GROUND_LEVEL
-
-    def check_collision(self, player_hitbox: pygame.Rect) -> bool:
+    def collide(self, player_hitbox: pygame.Rect,
+                prev_hitbox: Optional[pygame.Rect] = None) -> np.ndarray:
         """
-        FIXED: Proper hitbox collision detection.
+        FIXED: Proper hitbox collision detection, swept over the last step.
+
+        Each meteorite's motion relative to the player is treated as a segment
+        and tested against the player's hitbox grown by the meteorite's half
+        extents, so fast rocks or long steps can't tunnel through the player.
+        Only meteorites in the columns the player covered reach this narrow
+        phase.
 
         Args:
             player_hitbox: Player's hitbox rectangle
+            prev_hitbox: Player's hitbox at the previous step, assumes the
+                         player did not move if not provided
 
         Returns:
-            True if collision detected
+            Slot indices of meteorites that touched the hitbox during the step,
+            earliest contact first
         """
-        return self.hitbox.colliderect(player_hitbox) and not self.grounded
+        if prev_hitbox is None:
+            prev_hitbox = player_hitbox
 
-    def draw(self, screen: pygame.Surface, debug: bool = False):
+        left = min(player_hitbox.left, prev_hitbox.left)
+        right = max(player_hitbox.right, prev_hitbox.right)
+        candidates = self.grid.query(left, right - left)
+        self.last_candidates = len(candidates)
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+
+        idx = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        y = self.y[idx]
+        prev_y = self.prev_y[idx]
+
+        # Rocks grounded before this step are out of play; ones that just landed still swept
+        moving = ~self.grounded[idx] | (prev_y < y)
+
+        # Meteorite center relative to the player's, at the start of the step and its motion
+        half = C.METEORITE_SIZE / 2
+        rel_x = self.x[idx] + half - prev_hitbox.centerx
+        rel_y = prev_y + half - prev_hitbox.centery
+        move_x = prev_hitbox.centerx - player_hitbox.centerx
+        move_y = (y - prev_y) - (player_hitbox.centery - prev_hitbox.centery)
+
+        enter_x, exit_x = _slab(rel_x, move_x, self.half_w[idx] + player_hitbox.width / 2)
+        enter_y, exit_y = _slab(rel_y, move_y, self.half_h[idx] + player_hitbox.height / 2)
+        enter = np.maximum(np.maximum(enter_x, enter_y), 0.0)
+        leave = np.minimum(np.minimum(exit_x, exit_y), 1.0)
+
+        hits = np.flatnonzero(moving & (enter < leave))
+        return idx[hits[np.argsort(enter[hits], kind='stable')]]
+
+    def grounded_indices(self) -> np.ndarray:
         """
-        Draw meteorite with rotation.
+        Get meteorites that have landed.
+
+        Returns:
+            Slot indices of grounded meteorites
+        """
+        return np.flatnonzero(self.grounded[:self.count])
+
+    def release(self, indices: np.ndarray):
+        """
+        Remove meteorites, moving the last live slots into the holes.
+
+        Args:
+            indices: Slot indices to remove (duplicates allowed)
+        """
+        if len(indices) == 0:
+            return
+        dead = np.unique(indices)
+
+        n = self.count
+        new_count = n - dead.size
+
+        # Holes below the new end get filled from live slots above it
+        holes = dead[dead < new_count]
+        tail = np.ones(n - new_count, dtype=bool)
+        tail[dead[dead >= new_count] - new_count] = False
+        movers = np.flatnonzero(tail) + new_count
+
+        for name, _ in _FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+
+        grid = self.grid
+        for slot in dead.tolist():
+            grid.remove(slot)
+        for hole, mover in zip(holes.tolist(), movers.tolist(), strict=True):
+            grid.rename(mover, hole)
+
+        self.count = new_count
+        self.released += dead.size
+
+    def clear(self):
+        """Remove all meteorites."""
+        self.released += self.count
+        self.count = 0
+        self.grid.clear()
+
+    def positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get top-left positions of airborne meteorites.
+
+        Returns:
+            Tuple of (x, y) arrays
+        """
+        airborne = ~self.grounded[:self.count]
+        return self.x[:self.count][airborne], self.y[:self.count][airborne]
+
+    def stats(self) -> dict:
+        """
+        Get slot occupancy.
+
+        Returns:
+            Dictionary with active, capacity, spawned, released, peak and grow counts
+        """
+        return {
+            'active': self.count,
+            'capacity': self.capacity,
+            'spawned': self.spawned,
+            'released': self.released,
+            'peak': self.peak,
+            'grows': self.grows
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def draw(self, screen: pygame.Surface, debug: bool = False, alpha: float = 1.0) -> list:
+        """
+        Draw all airborne meteorites from their pre-rotated frames.
 
         Args:
             screen: Pygame surface to draw on
-            debug: If True, draw hitbox outline
+            debug: If True, draw hitbox outlines
+            alpha: Interpolation factor between previous (0) and current (1) step
+
+        Returns:
+            List of screen areas that were drawn
         """
-        if not self.grounded:
-            # Rotate image
-            rotated_image = pygame.transform.rotate(self.image, self.rotation)
-            rotated_rect = rotated_image.get_rect(center=self.rect.center)
-            screen.blit(rotated_image, rotated_rect)
+        n = self.count
+        if n == 0:
+            return []
+        if not self._rock_frames:
+            self._load_frames()
+
+        steps = len(self._rock_frames[0])
+        half = C.METEORITE_SIZE // 2
+        airborne = np.flatnonzero(~self.grounded[:n])
+
+        # Nearest pre-rotated frame and interpolated center, for all at once
+        frame_index = np.rint(self.rotation[airborne] * steps / 360.0).astype(np.int64) % steps
+        center_x = self.x[airborne].astype(np.int64) + half
+        prev_y = self.prev_y[airborne]
+        center_y = (prev_y + (self.y[airborne] - prev_y) * alpha).astype(np.int64) + half
+
+        rock_frames = self._rock_frames
+        blits = []
+        for rock, frame, cx, cy in zip(self.rock[airborne].tolist(), frame_index.tolist(),
+                                       center_x.tolist(), center_y.tolist(), strict=True):
+            image = rock_frames[rock][frame]
+            blits.append((image, (cx - image.get_width() // 2, cy - image.get_height() // 2)))
+
+        dirty = screen.blits(blits)
+
+        if debug:
+            for i in airborne.tolist():
+                hitbox = pygame.Rect(0, 0, int(self.half_w[i] * 2), int(self.half_h[i] * 2))
+                hitbox.center = (int(self.x[i]) + half, int(self.y[i]) + half)
+                pygame.draw.rect(screen, (255, 0, 0), hitbox, 2)
 
-            if debug:
-                pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 2)
-                pygame.draw.rect(screen, (255, 255, 0), self.rect, 1)
+        return dirty
@@ -3,8 +3,10 @@ Player entity with proper hitbox, animations, and physics.
 """
 import pygame
 from enum import Enum
+from typing import Optional
 from ..config import constants as C
 from ..core.asset_loader import AssetLoader
+from ..core.effect_cache import EffectCache
 
 
 class PlayerState(Enum):
@@ -15,6 +17,36 @@ class PlayerState(Enum):
     RUNNING_LEFT = 3
 
 
+class PlayerInput:
+    """Snapshot of the player controls for a single update."""
+
+    __slots__ = ('left', 'right', 'jump')
+
+    def __init__(self, left: bool = False, right: bool = False, jump: bool = False):
+        """
+        Initialize input snapshot.
+
+        Args:
+            left: True if moving left
+            right: True if moving right
+            jump: True if the jump key is held
+        """
+        self.left = left
+        self.right = right
+        self.jump = jump
+
+    @classmethod
+    def from_keyboard(cls) -> 'PlayerInput':
+        """
+        Build an input snapshot from the current keyboard state.
+
+        Returns:
+            PlayerInput for the arrow keys
+        """
+        keys = pygame.key.get_pressed()
+        return cls(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP])
+
+
 class Player:
     """Player character with animations and physics."""
 
@@ -26,6 +58,7 @@ class Player:
 
         # Position and physics
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = pygame.math.Vector2(x, y)  # Position at previous step, for interpolation
         self.vel = pygame.math.Vector2(0, 0)
 
         # Sprite and hitbox
@@ -39,6 +72,7 @@ class Player:
             C.PLAYER_HITBOX_WIDTH,
             C.PLAYER_HITBOX_HEIGHT
         )
+        self.prev_hitbox = self.hitbox.copy()  # Hitbox at previous step, for swept collision
 
         # State
         self.state = PlayerState.IDLE_RIGHT
@@ -54,8 +88,13 @@ class Player:
         self.is_invincible = False
 
     def _load_animations(self):
-        """Load all animation frames."""
+        """Load all animation frames (scaled and flipped once per process by the asset loader)."""
         frames = self.asset_loader.load_sprite_sheet(C.PLAYER_SPRITE_SHEET, 24, 23)
+        size = (C.PLAYER_SIZE, C.PLAYER_SIZE)
+
+        def variant(index: int, flip_x: bool = False) -> pygame.Surface:
+            return self.asset_loader.load_variant(C.PLAYER_SPRITE_SHEET, size, flip_x,
+                                                  frame=(24, 23, index))
 
         self.animations = {
             PlayerState.IDLE_RIGHT: [],
@@ -67,46 +106,47 @@ class Player:
         # Idle frames (0-3)
         for i in range(C.IDLE_ANIMATION_FRAMES):
             if i < len(frames):
-                img = pygame.transform.scale(frames[i], (C.PLAYER_SIZE, C.PLAYER_SIZE))
-                img_left = pygame.transform.flip(img, True, False)
-                self.animations[PlayerState.IDLE_RIGHT].append(img)
-                self.animations[PlayerState.IDLE_LEFT].append(img_left)
+                self.animations[PlayerState.IDLE_RIGHT].append(variant(i))
+                self.animations[PlayerState.IDLE_LEFT].append(variant(i, flip_x=True))
 
         # Running frames (4-13)
         for i in range(C.WALK_ANIMATION_FRAMES):
             frame_idx = i + 4
             if frame_idx < len(frames):
-                img = pygame.transform.scale(frames[frame_idx], (C.PLAYER_SIZE, C.PLAYER_SIZE))
-                img_left = pygame.transform.flip(img, True, False)
-                self.animations[PlayerState.RUNNING_RIGHT].append(img)
-                self.animations[PlayerState.RUNNING_LEFT].append(img_left)
+                self.animations[PlayerState.RUNNING_RIGHT].append(variant(frame_idx))
+                self.animations[PlayerState.RUNNING_LEFT].append(variant(frame_idx, flip_x=True))
 
-    def update(self, dt: float):
+    def update(self, dt: float, inputs: Optional[PlayerInput] = None):
         """
         Update player state, physics, and animation.
 
         Args:
             dt: Delta time in seconds
+            inputs: Controls for this update, reads the keyboard if not provided
         """
-        self._handle_input(dt)
+        if inputs is None:
+            inputs = PlayerInput.from_keyboard()
+
+        self.prev_pos.update(self.pos)
+        self.prev_hitbox.update(self.hitbox)
+
+        self._handle_input(inputs)
         self._apply_physics(dt)
         self._update_animation(dt)
         self._update_hitbox()  # FIXED: Always update hitbox
 
-    def _handle_input(self, dt: float):
-        """Process keyboard input."""
-        keys = pygame.key.get_pressed()
-
+    def _handle_input(self, inputs: PlayerInput):
+        """Process player input."""
         # Horizontal movement
         dx = 0
         moving = False
 
-        if keys[pygame.K_LEFT] and self.pos.x > 0:
+        if inputs.left and self.pos.x > 0:
             dx = -C.PLAYER_SPEED
             moving = True
             if self.grounded:
                 self.state = PlayerState.RUNNING_LEFT
-        elif keys[pygame.K_RIGHT] and self.pos.x < C.SCREEN_WIDTH - C.PLAYER_SIZE:
+        elif inputs.right and self.pos.x < C.SCREEN_WIDTH - C.PLAYER_SIZE:
             dx = C.PLAYER_SPEED
             moving = True
             if self.grounded:
@@ -122,13 +162,13 @@ class Player:
         self.vel.x = dx
 
         # Jump
-        if keys[pygame.K_UP] and self.can_jump and self.grounded:
+        if inputs.jump and self.can_jump and self.grounded:
             self.vel.y = C.JUMP_VELOCITY
             self.grounded = False
             self.can_jump = False
 
         # Reset jump when key released
-        if not keys[pygame.K_UP]:
+        if not inputs.jump:
             self.can_jump = True
 
     def _apply_physics(self, dt: float):
@@ -179,32 +219,40 @@ class Player:
             y: Y coordinate
         """
         self.pos = pygame.math.Vector2(x, y)
+        self.prev_pos = pygame.math.Vector2(x, y)
         self.vel = pygame.math.Vector2(0, 0)
         self.rect.x = int(x)
         self.rect.y = int(y)
         self._update_hitbox()
+        self.prev_hitbox = self.hitbox.copy()
         self.grounded = False
         self.state = PlayerState.IDLE_RIGHT
         self.frame_index = 0
 
-    def draw(self, screen: pygame.Surface, debug: bool = False):
+    def draw(self, screen: pygame.Surface, debug: bool = False, alpha: float = 1.0) -> pygame.Rect:
         """
         Draw player and optionally hitbox.
 
         Args:
             screen: Pygame surface to draw on
             debug: If True, draw hitbox outline
+            alpha: Interpolation factor between previous (0) and current (1) step
+
+        Returns:
+            Screen area that was drawn
         """
-        screen.blit(self.image, self.rect)
+        draw_pos = self.prev_pos.lerp(self.pos, alpha)
+        draw_rect = self.rect.move(int(draw_pos.x) - self.rect.x, int(draw_pos.y) - self.rect.y)
+        dirty = screen.blit(self.image, draw_rect)
 
         # Draw shield effect if active
         if self.has_shield:
-            shield_surf = pygame.Surface((C.PLAYER_SIZE + 10, C.PLAYER_SIZE + 10), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surf, (100, 200, 255, 100),
-                             (C.PLAYER_SIZE // 2 + 5, C.PLAYER_SIZE // 2 + 5),
-                             C.PLAYER_SIZE // 2 + 5)
-            screen.blit(shield_surf, (self.rect.x - 5, self.rect.y - 5))
+            shield_surf = EffectCache().shield_bubble(C.PLAYER_SIZE // 2 + 5)
+            dirty.union_ip(screen.blit(shield_surf, (draw_rect.x - 5, draw_rect.y - 5)))
 
         if debug:
             pygame.draw.rect(screen, (0, 255, 0), self.hitbox, 2)
             pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
+            dirty.union_ip(self.rect)
+
+        return dirty
@@ -1,13 +1,16 @@
 """
 Collectible power-ups with different effects.
 """
+import math
 import pygame
 import random
 import os
 from enum import Enum
-from typing import List
+from typing import List, Optional
 from ..config import constants as C
 from ..core.asset_loader import AssetLoader
+from ..core.effect_cache import EffectCache
+from ..systems.broadphase import ColumnGrid
 
 
 class PowerUpType(Enum):
@@ -46,6 +49,7 @@ class PowerUp:
         self.lifetime = 10.0  # Despawn after 10 seconds
         self.bob_offset = 0
         self.bob_speed = 3
+        self.seq = 0  # Spawn order, assigned by PowerUpManager
 
     def _create_fallback_image(self, powerup_type: PowerUpType) -> pygame.Surface:
         """Create a simple colored circle as fallback image."""
@@ -76,7 +80,7 @@ class PowerUp:
 
         # Bobbing animation
         self.bob_offset += self.bob_speed * dt
-        bob_y = 5 * pygame.math.Vector2(0, 1).rotate(self.bob_offset * 50).y
+        bob_y = 5 * math.cos(math.radians(self.bob_offset * 50))
         self.rect.centery = int(self.pos.y + bob_y)
 
     def check_collision(self, player_hitbox: pygame.Rect) -> bool:
@@ -98,45 +102,59 @@ class PowerUp:
         """Check if power-up should despawn."""
         return self.lifetime <= 0 or self.collected
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
         """
         Draw power-up with glow effect.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area that was drawn, or None if nothing was drawn
         """
         if not self.collected:
-            # Glow effect
-            glow_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
-            glow_alpha = int(100 + 50 * pygame.math.Vector2(0, 1).rotate(self.bob_offset * 100).y)
-            pygame.draw.circle(glow_surf, (255, 255, 0, max(0, min(255, glow_alpha))), (30, 30), 25)
-            screen.blit(glow_surf, (self.rect.centerx - 30, self.rect.centery - 30))
+            # Glow effect, pulsing between alpha 50 and 150
+            glow_surf = EffectCache().glow(math.cos(math.radians(self.bob_offset * 100)))
+            dirty = screen.blit(glow_surf, (self.rect.centerx - 30, self.rect.centery - 30))
 
             # Power-up sprite
-            screen.blit(self.image, self.rect)
+            dirty.union_ip(screen.blit(self.image, self.rect))
+            return dirty
+        return None
 
 
 class PowerUpManager:
     """Manages spawning and updating power-ups."""
 
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
+        """
+        Initialize manager.
+
+        Args:
+            rng: Random source for spawns, the global random module if not provided
+        """
+        self.rng = rng or random
         self.powerups: List[PowerUp] = []
         self.spawn_timer = 0.0
+        self.spawned = 0  # Sequence number for the next power-up
+        self.grid = ColumnGrid()  # Power-ups bob vertically, so they never change column
 
-    def update(self, dt: float, world_data: list):
+    def update(self, dt: float, world_data: list, spawn: bool = True):
         """
         Update all power-ups and spawn new ones.
 
         Args:
             dt: Delta time in seconds
             world_data: World tile data for spawn positioning
+            spawn: If False, only animate existing power-ups
         """
-        self.spawn_timer += dt
+        if spawn:
+            self.spawn_timer += dt
 
         # Spawn new power-up
-        if self.spawn_timer >= 1.0:
-            self.spawn_timer = 0.0
-            if random.random() < C.POWERUP_SPAWN_CHANCE:
+        while self.spawn_timer >= 1.0:
+            self.spawn_timer -= 1.0  # Keep the leftover so rolls stay once per second
+            if self.rng.random() < C.POWERUP_SPAWN_CHANCE:
                 self._spawn_random_powerup(world_data)
 
         # Update existing power-ups
@@ -144,16 +162,20 @@ class PowerUpManager:
             powerup.update(dt)
             if powerup.is_expired():
                 self.powerups.remove(powerup)
+                self.grid.remove(powerup)
 
     def _spawn_random_powerup(self, world_data: list):
         """Spawn a random power-up at a random location."""
         max_tiles = len(world_data[0])
-        spawn_x = random.randint(1, max_tiles - 1) * C.TILE_SIZE + C.TILE_SIZE // 2
+        spawn_x = self.rng.randint(1, max_tiles - 1) * C.TILE_SIZE + C.TILE_SIZE // 2
         spawn_y = C.GROUND_LEVEL - 100
 
-        powerup_type = random.choice(list(PowerUpType))
+        powerup_type = self.rng.choice(list(PowerUpType))
         powerup = PowerUp(spawn_x, spawn_y, powerup_type)
+        powerup.seq = self.spawned
+        self.spawned += 1
         self.powerups.append(powerup)
+        self.grid.insert(powerup, powerup.rect.x, powerup.rect.width)
 
     def check_collisions(self, player_hitbox: pygame.Rect) -> List[PowerUpType]:
         """
@@ -165,8 +187,10 @@ class PowerUpManager:
         Returns:
             List of collected power-up types
         """
+        candidates = self.grid.query(player_hitbox.x, player_hitbox.width)
         collected = []
-        for powerup in self.powerups:
+        # The grid query is an unordered set, so sort it into spawn order
+        for powerup in sorted(candidates, key=lambda p: p.seq):
             if powerup.check_collision(player_hitbox):
                 collected.append(powerup.type)
         return collected
@@ -174,13 +198,21 @@ class PowerUpManager:
     def clear(self):
         """Remove all power-ups."""
         self.powerups.clear()
+        self.grid.clear()
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> list:
         """
         Draw all active power-ups.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
+        dirty = []
         for powerup in self.powerups:
-            powerup.draw(screen)
+            rect = powerup.draw(screen)
+            if rect:
+                dirty.append(rect)
+        return dirty
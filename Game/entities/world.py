@@ -18,6 +18,7 @@ class World:
         """
         self.asset_loader = AssetLoader()
         self.tile_list = []
+        self.version = 0  # Bumped whenever tiles change, for cached backgrounds
 
         # Default world data if none provided
         if data is None:
@@ -26,6 +27,18 @@ class World:
         self.data = data
         self._load_tiles()
 
+    def set_data(self, data: list):
+        """
+        Replace the level tiles.
+
+        Args:
+            data: 2D list where 0=empty, 1=dirt, 2=grass
+        """
+        self.data = data
+        self.tile_list = []
+        self._load_tiles()
+        self.version += 1
+
     def _load_tiles(self):
         """Load and position all tiles based on data."""
         # Load tile images
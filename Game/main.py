@@ -7,6 +7,11 @@ import sys
 from .core.game_engine import GameEngine
 from .core.state_manager import StateManager, GameState
 from .core.asset_loader import AssetLoader
+from .core.simulation import Simulation, SimEvent
+from .core.renderer import DirtyRectRenderer
+from .core.background import BackgroundCache
+from .core.font_manager import FontManager
+from .core.effect_cache import EffectCache
 from .config import constants as C
 from .utils import colors
 
@@ -15,34 +20,44 @@ from .ui.menu import MainMenu, DifficultySelect
 from .ui.tutorial_screen import TutorialScreen
 from .ui.game_over_screen import GameOverScreen
 from .ui.hud import HUD
-from .entities.player import Player
-from .entities.meteorite import Meteorite
+from .entities.player import PlayerInput
 from .entities.world import World
-from .entities.powerup import PowerUpManager
 from .systems.audio_manager import AudioManager
 from .systems.score_manager import ScoreManager
-from .systems.difficulty_manager import DifficultyManager
 from .systems.particle_system import ParticleSystem
 from .systems.physics import Ragdoll
+from .systems.profiler import FrameProfiler
 
 
 class DodgeGame:
     """Main game class."""
 
-    def __init__(self):
+    # States drawn on top of the tilemap
+    WORLD_STATES = (GameState.COUNTDOWN, GameState.PLAYING, GameState.PAUSED, GameState.DYING)
+
+    def __init__(self, profile_dump: str = None, dirty_rects: bool = C.DIRTY_RECT_RENDERING,
+                 seed: int = None):
+        """
+        Initialize game.
+
+        Args:
+            profile_dump: Optional path where frame timings are written as JSON on exit
+            dirty_rects: If True, only redraw and present screen areas that changed
+            seed: Optional seed making every game's spawns and effects reproducible
+        """
+        self.seed = seed
         # Core systems
         self.engine = GameEngine()
+        self.profiler = FrameProfiler()
+        self.profile_dump = profile_dump
         self.state_manager = StateManager()
         self.asset_loader = AssetLoader()
+        self.fonts = FontManager()
         self.audio = AudioManager()
 
         # Load assets
         self.asset_loader.preload_all_assets()
 
-        # Background
-        self.bg_img = self.asset_loader.load_image(C.SKY_IMAGE)
-        self.sun_img = self.asset_loader.load_image(C.SUN_IMAGE)
-
         # UI screens
         self.main_menu = MainMenu()
         self.difficulty_select = DifficultySelect()
@@ -50,44 +65,63 @@ class DodgeGame:
         self.game_over_screen = GameOverScreen()
         self.hud = HUD()
 
-        # Game objects (initialized when game starts)
+        # Game objects (simulation is created when game starts)
         self.world = World()
-        self.player = None
-        self.meteorites = []
+        self.sim = None
         self.ragdoll = None
 
+        # Rendering
+        self.background = BackgroundCache(self.world)
+        self.renderer = DirtyRectRenderer(self.engine.screen, self._get_background(), dirty_rects)
+
         # Systems
         self.score_manager = ScoreManager()
-        self.difficulty_manager = None
-        self.powerup_manager = PowerUpManager()
         self.particle_system = ParticleSystem()
 
         # Game state
         self.countdown_timer = C.COUNTDOWN_DURATION
         self.countdown_start = 0
-        self.game_start_time = 0
-        self.active_powerups = []
-        self.last_jump_state = False  # Track jump for particles
+        self.dying_elapsed = 0.0
+        self.pause_overlay = None
 
         # Start music
         self.audio.play_music()
 
     def run(self):
         """Main game loop."""
+        profiler = self.profiler
         while self.engine.running:
             self.engine.update()
             dt = self.engine.get_delta_time()
+            profiler.begin_frame()
 
             # Handle events
-            self._handle_events()
+            with profiler.section('events'):
+                self._handle_events()
 
             # Update current state
-            self._update_state(dt)
+            with profiler.section('update'):
+                self._update_state(dt)
 
             # Draw current state
-            self._draw_state()
+            with profiler.section('draw'):
+                self._draw_state()
+                self.renderer.mark(profiler.draw(self.engine.screen))
 
-            pygame.display.flip()
+            with profiler.section('flip'):
+                self.renderer.present()
+
+            text_stats = self.fonts.stats()
+            profiler.set_counter('text.entries', text_stats['entries'])
+            profiler.set_counter('text.hit_rate', round(text_stats['hit_rate'], 3))
+            profiler.set_counter('hud.rebuilds', self.hud.rebuilds)
+            profiler.end_frame()
+            self.particle_system.govern(profiler.last_frame_time)
+
+        if self.profile_dump:
+            self.profiler.dump(self.profile_dump)
+
+        self.score_manager.flush()
 
         pygame.quit()
         sys.exit()
@@ -98,7 +132,9 @@ class DodgeGame:
             if event.type == pygame.QUIT:
                 self.engine.running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p and self.state_manager.is_state(GameState.PLAYING):
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif event.key == pygame.K_p and self.state_manager.is_state(GameState.PLAYING):
                     self.state_manager.transition_to(GameState.PAUSED)
                     self.audio.play_sfx('menu_click')
                 elif event.key == pygame.K_p and self.state_manager.is_state(GameState.PAUSED):
@@ -107,6 +143,9 @@ class DodgeGame:
 
     def _update_state(self, dt: float):
         """Update based on current state."""
+        # Drain the accumulator every frame so menus and pauses don't bank time
+        steps = self.engine.consume_fixed_steps()
+
         if self.state_manager.is_state(GameState.MENU):
             new_state = self.main_menu.update(pygame.mouse.get_pos())
             if new_state != GameState.MENU:
@@ -134,7 +173,20 @@ class DodgeGame:
             self._update_countdown()
 
         elif self.state_manager.is_state(GameState.PLAYING):
-            self._update_game(dt)
+            if not self.engine.fixed_timestep:
+                self._update_game(dt)
+            for _ in range(steps):
+                self._update_game(self.engine.fixed_dt)
+                if not self.state_manager.is_state(GameState.PLAYING):
+                    break
+
+        elif self.state_manager.is_state(GameState.DYING):
+            if not self.engine.fixed_timestep:
+                self._update_dying(dt)
+            for _ in range(steps):
+                self._update_dying(self.engine.fixed_dt)
+                if not self.state_manager.is_state(GameState.DYING):
+                    break
 
         elif self.state_manager.is_state(GameState.GAME_OVER):
             new_state = self.game_over_screen.update(pygame.mouse.get_pos())
@@ -142,25 +194,30 @@ class DodgeGame:
                 self.state_manager.transition_to(new_state)
                 self.audio.play_sfx('menu_click')
 
+        # Only a running simulation has a step to blend into; frozen scenes draw as they are
+        if not self.state_manager.is_state(GameState.PLAYING):
+            self.engine.interpolation_alpha = 1.0
+
     def _draw_state(self):
         """Draw based on current state."""
-        # Background
-        self.engine.screen.blit(self.bg_img, (0, 0))
-        self.engine.screen.blit(self.sun_img, (100, 100))
+        # Background (erases last frame in dirty-rect mode)
+        with self.profiler.section('draw.background'):
+            self.renderer.set_background(self._get_background())
+            self.renderer.begin_frame()
 
         if self.state_manager.is_state(GameState.MENU):
-            self.main_menu.draw(self.engine.screen)
+            self.renderer.mark(self.main_menu.draw(self.engine.screen))
 
         elif self.state_manager.is_state(GameState.DIFFICULTY_SELECT):
-            self.difficulty_select.draw(self.engine.screen)
+            self.renderer.mark(self.difficulty_select.draw(self.engine.screen))
 
         elif self.state_manager.is_state(GameState.TUTORIAL):
-            self.tutorial.draw(self.engine.screen)
+            self.renderer.mark(self.tutorial.draw(self.engine.screen))
 
         elif self.state_manager.is_state(GameState.COUNTDOWN):
             self._draw_countdown()
 
-        elif self.state_manager.is_state(GameState.PLAYING):
+        elif self.state_manager.is_state(GameState.PLAYING) or self.state_manager.is_state(GameState.DYING):
             self._draw_game()
 
         elif self.state_manager.is_state(GameState.PAUSED):
@@ -170,20 +227,22 @@ class DodgeGame:
         elif self.state_manager.is_state(GameState.GAME_OVER):
             self._draw_game_over()
 
+    def _get_background(self) -> pygame.Surface:
+        """Get the cached background for the current state."""
+        return self.background.get(
+            self.engine.screen.get_size(),
+            with_world=self.state_manager.current_state in self.WORLD_STATES
+        )
+
     def _start_game(self, difficulty: str):
         """Initialize new game."""
         # Reset systems
-        self.score_manager.reset()
-        self.difficulty_manager = DifficultyManager(difficulty)
-        self.meteorites = []
-        self.active_powerups = []
+        self.sim = Simulation(difficulty, self.world.data, self.score_manager, self.profiler,
+                              seed=self.seed)
         self.particle_system.clear()
-        self.powerup_manager.clear()
+        self.particle_system.rng = self.sim.rng.numpy('cosmetics')
         self.ragdoll = None
 
-        # Create player
-        self.player = Player(100, C.GROUND_LEVEL)
-
         # Start countdown
         self.countdown_timer = C.COUNTDOWN_DURATION
         self.countdown_start = pygame.time.get_ticks()
@@ -195,197 +254,153 @@ class DodgeGame:
         self.countdown_timer = C.COUNTDOWN_DURATION - int(elapsed)
 
         if self.countdown_timer <= 0:
-            self.game_start_time = pygame.time.get_ticks()
             self.state_manager.transition_to(GameState.PLAYING)
 
     def _update_game(self, dt: float):
-        """Update game logic."""
-        game_time = (pygame.time.get_ticks() - self.game_start_time) // 1000
-
-        # Update systems
-        self.difficulty_manager.update(dt)
-        self.score_manager.update(dt)
-        self.score_manager.check_multiplier_expiry()
-
-        # Update player
-        was_grounded = self.player.grounded
-        self.player.update(dt)
-
-        # Emit jump particles
-        if was_grounded and not self.player.grounded:
-            self.particle_system.emit_jump(self.player.rect.x, self.player.rect.y)
-            self.audio.play_sfx('jump')
-
-        # Spawn meteorites
-        if self.difficulty_manager.should_spawn_meteorite():
-            meteorite = Meteorite(self.world.data)
-            meteorite.velocity = self.difficulty_manager.get_meteorite_speed()
-            self.meteorites.append(meteorite)
-
-        # Update meteorites (FIXED: No list modification during iteration)
-        meteorites_to_remove = []
-        for meteorite in self.meteorites:
-            meteorite.update(dt)
-
+        """Step the simulation and turn its events into effects."""
+        events = self.sim.step(dt, PlayerInput.from_keyboard())
+
+        for event, data in events:
+            if event == SimEvent.JUMP:
+                self.particle_system.emit_jump(data[0], data[1])
+                self.audio.play_sfx('jump')
+            elif event == SimEvent.SHIELD_HIT:
+                self.particle_system.emit_collision(data[0], data[1])
+                self.audio.play_sfx('collision')
+            elif event == SimEvent.POWERUP_COLLECTED:
+                self.particle_system.emit_powerup_collect(data[0], data[1])
+                self.audio.play_sfx('powerup')
+            elif event == SimEvent.PLAYER_KILLED:
+                self._trigger_game_over()
+                return
+
+        with self.profiler.section('particles.update'):
             # Emit trail particles
-            if not meteorite.grounded:
-                self.particle_system.emit_meteorite_trail(meteorite.rect.x, meteorite.rect.y)
-
-            # Check collision
-            if meteorite.check_collision(self.player.hitbox):
-                if self.player.has_shield:
-                    # Shield absorbs hit
-                    self.player.has_shield = False
-                    self.active_powerups = [p for p in self.active_powerups if 'Shield' not in p]
-                    meteorites_to_remove.append(meteorite)
-                    self.particle_system.emit_collision(meteorite.rect.x, meteorite.rect.y)
-                    self.audio.play_sfx('collision')
-                else:
-                    # Game over
-                    self._trigger_game_over()
-                    return
-
-            if meteorite.grounded:
-                meteorites_to_remove.append(meteorite)
-                self.score_manager.add_meteorite_dodge()
-
-        for meteorite in meteorites_to_remove:
-            self.meteorites.remove(meteorite)
-
-        # Update power-ups
-        self.powerup_manager.update(dt, self.world.data)
-        collected = self.powerup_manager.check_collisions(self.player.hitbox)
-        for powerup_type in collected:
-            self._apply_powerup(powerup_type)
-
-        # Update particles
-        self.particle_system.update(dt)
-
-    def _apply_powerup(self, powerup_type):
-        """Apply collected power-up."""
-        self.audio.play_sfx('powerup')
-        self.particle_system.emit_powerup_collect(
-            self.player.rect.centerx,
-            self.player.rect.centery
-        )
+            self.particle_system.emit_meteorite_trails(*self.sim.meteorites.positions(), dt)
 
-        if powerup_type.value == 'shield':
-            self.player.has_shield = True
-            self.active_powerups.append("Shield Active")
-        elif powerup_type.value == 'slowmo':
-            # Slow down meteorites temporarily
-            for meteorite in self.meteorites:
-                meteorite.velocity *= C.SLOWMO_FACTOR
-            self.active_powerups.append("Slow Motion")
-        elif powerup_type.value == 'multiplier':
-            self.score_manager.set_multiplier(C.SCORE_MULTIPLIER, C.MULTIPLIER_DURATION)
-            self.active_powerups.append("Score x2")
+            # Update particles
+            self.particle_system.update(dt)
+
+        pool_stats = self.sim.meteorites.stats()
+        self.profiler.set_counter('meteorites', pool_stats['active'])
+        self.profiler.set_counter('meteorites.capacity', pool_stats['capacity'])
+        self.profiler.set_counter('collision.candidates', self.sim.meteorites.last_candidates)
+        self.profiler.set_counter('particles', len(self.particle_system))
+        self.profiler.set_counter('particles.batch', self.particle_system.last_batch)
+        self.profiler.set_counter('particles.trail_density', round(self.particle_system.trail_density, 2))
+        self.profiler.set_counter('particles.evicted', self.particle_system.evicted)
+        self.profiler.set_counter('particles.sprites', EffectCache().stats()['particle_sprites'])
 
     def _trigger_game_over(self):
-        """Handle game over."""
+        """Handle game over - save the score and start the ragdoll death animation."""
+        # The score is final here; saving now keeps it if the window closes mid-animation
+        if self.score_manager.is_high_score():
+            self.score_manager.save_high_score()
+
         self.audio.play_sfx('game_over')
-        self.ragdoll = Ragdoll(self.player.rect.x, self.player.rect.y)
-        self.particle_system.emit_collision(self.player.rect.centerx, self.player.rect.centery)
+        player = self.sim.player
+        self.ragdoll = Ragdoll(player.rect.x, player.rect.y, rng=self.sim.rng.numpy('cosmetics'))
+        self.particle_system.emit_collision(player.rect.centerx, player.rect.centery)
 
-        # Animate ragdoll
-        start_time = pygame.time.get_ticks()
-        while not self.ragdoll.finished and pygame.time.get_ticks() - start_time < 3000:
-            dt = self.engine.clock.tick(C.FPS) / 1000.0
-            self.ragdoll.update(dt)
+        self.dying_elapsed = 0.0
+        self.pause_overlay = None
+        self.state_manager.transition_to(GameState.DYING)
 
-            # Draw game with ragdoll
-            self.engine.screen.blit(self.bg_img, (0, 0))
-            self.engine.screen.blit(self.sun_img, (100, 100))
-            self.world.draw(self.engine.screen)
+    def _update_dying(self, dt: float):
+        """Animate the ragdoll, then move on to the game over screen."""
+        self.dying_elapsed += dt
 
-            for meteorite in self.meteorites:
-                meteorite.draw(self.engine.screen)
+        with self.profiler.section('ragdoll.update'):
+            self.ragdoll.update(dt)
 
-            self.ragdoll.draw(self.engine.screen)
-            pygame.display.flip()
+        # Keep the world alive behind the ragdoll
+        self.sim.powerup_manager.update(dt, self.sim.world_data, spawn=False)
+        with self.profiler.section('particles.update'):
+            self.particle_system.update(dt)
 
-        # Save score
-        if self.score_manager.is_high_score():
-            self.score_manager.save_high_score()
+        if self.ragdoll.finished or self.dying_elapsed >= C.DEATH_ANIMATION_DURATION:
+            self._finish_game_over()
 
+    def _finish_game_over(self):
+        """Show the game over screen."""
         self.state_manager.transition_to(GameState.GAME_OVER)
 
     def _draw_game(self):
         """Draw game objects."""
-        # World
-        self.world.draw(self.engine.screen)
+        alpha = self.engine.interpolation_alpha
+        profiler = self.profiler
+        screen = self.engine.screen
+        mark = self.renderer.mark
+
+        # World tiles are part of the background
 
         # Meteorites
-        for meteorite in self.meteorites:
-            meteorite.draw(self.engine.screen)
+        with profiler.section('draw.meteorites'):
+            mark(self.sim.meteorites.draw(screen, alpha=alpha))
 
         # Power-ups
-        self.powerup_manager.draw(self.engine.screen)
+        with profiler.section('draw.powerups'):
+            mark(self.sim.powerup_manager.draw(screen))
 
         # Particles
-        self.particle_system.draw(self.engine.screen)
+        with profiler.section('draw.particles'):
+            mark(self.particle_system.draw(screen))
 
         # Player or ragdoll
-        if self.ragdoll and not self.state_manager.is_state(GameState.PLAYING):
-            self.ragdoll.draw(self.engine.screen)
-        else:
-            self.player.draw(self.engine.screen)
+        with profiler.section('draw.player'):
+            if self.ragdoll and not self.state_manager.is_state(GameState.PLAYING):
+                mark(self.ragdoll.draw(screen))
+            else:
+                mark(self.sim.player.draw(screen, alpha=alpha))
 
         # HUD
-        game_time = (pygame.time.get_ticks() - self.game_start_time) // 1000
-        self.hud.draw(
-            self.engine.screen,
-            self.score_manager.current_score,
-            game_time,
-            self.score_manager.score_multiplier,
-            self.active_powerups
-        )
+        with profiler.section('draw.hud'):
+            mark(self.hud.draw(
+                screen,
+                self.score_manager.current_score,
+                int(self.sim.time),
+                self.score_manager.score_multiplier,
+                self.sim.active_powerups
+            ))
 
     def _draw_countdown(self):
         """Draw countdown."""
-        self.world.draw(self.engine.screen)
-        if self.player:
-            self.player.draw(self.engine.screen)
+        if self.sim:
+            self.renderer.mark(self.sim.player.draw(self.engine.screen))
 
-        font = pygame.font.SysFont(None, 72)
         if self.countdown_timer > 0:
-            text = font.render(str(self.countdown_timer), True, colors.white)
+            text = self.fonts.render(str(self.countdown_timer), 72, colors.white)
         else:
-            text = font.render("GO!", True, colors.green)
+            text = self.fonts.render("GO!", 72, colors.green)
 
         text_rect = text.get_rect(center=(C.SCREEN_WIDTH // 2, C.SCREEN_HEIGHT // 2))
-        self.engine.screen.blit(text, text_rect)
+        self.renderer.mark(self.engine.screen.blit(text, text_rect))
 
     def _draw_pause_overlay(self):
         """Draw pause overlay."""
-        overlay = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.engine.screen.blit(overlay, (0, 0))
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT), pygame.SRCALPHA)
+            self.pause_overlay.fill((0, 0, 0, 128))
+        self.renderer.mark(self.engine.screen.blit(self.pause_overlay, (0, 0)))
 
-        font = pygame.font.SysFont(None, 48)
-        text = font.render("PAUSED", True, colors.white)
+        text = self.fonts.render("PAUSED", 48, colors.white)
         text_rect = text.get_rect(center=(C.SCREEN_WIDTH // 2, C.SCREEN_HEIGHT // 2))
         self.engine.screen.blit(text, text_rect)
 
-        info_font = pygame.font.SysFont(None, 24)
-        info = info_font.render("Press P to resume", True, colors.white)
+        info = self.fonts.render("Press P to resume", 24, colors.white)
         info_rect = info.get_rect(center=(C.SCREEN_WIDTH // 2, C.SCREEN_HEIGHT // 2 + 50))
         self.engine.screen.blit(info, info_rect)
 
     def _draw_game_over(self):
         """Draw game over screen."""
-        self.engine.screen.blit(self.bg_img, (0, 0))
-        self.engine.screen.blit(self.sun_img, (100, 100))
-
-        game_time = (pygame.time.get_ticks() - self.game_start_time) // 1000
-        self.game_over_screen.draw(
+        self.renderer.mark(self.game_over_screen.draw(
             self.engine.screen,
             self.score_manager.current_score,
-            game_time,
+            int(self.sim.time),
             self.score_manager.is_high_score(),
             self.score_manager.get_rank(),
             self.score_manager.high_scores
-        )
+        ))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,119 @@
+"""
+Column-bucketed broadphase for collision detection.
+"""
+import math
+from typing import Dict, Hashable, Set, Tuple
+from ..config import constants as C
+
+
+class ColumnGrid:
+    """
+    Spatial hash over vertical screen columns.
+
+    Meteorites and power-ups live on tile columns, so bucketing entities by the
+    columns their hitbox spans lets collision checks skip everything outside
+    the player's columns. Buckets are maintained incrementally: entities are
+    only re-bucketed when the columns they span actually change.
+    """
+
+    def __init__(self, column_width: int = C.TILE_SIZE):
+        """
+        Initialize an empty grid.
+
+        Args:
+            column_width: Width of one bucket in pixels
+        """
+        self.column_width = column_width
+        self.buckets: Dict[int, Set[Hashable]] = {}
+        self._spans: Dict[Hashable, Tuple[int, int]] = {}
+
+    def _span(self, left: float, width: float) -> Tuple[int, int]:
+        """First and last column touched by [left, left + width)."""
+        first = int(math.floor(left / self.column_width))
+        last = int(math.ceil((left + width) / self.column_width)) - 1
+        return first, max(first, last)
+
+    def insert(self, entity_id: Hashable, left: float, width: float):
+        """
+        Add an entity.
+
+        Args:
+            entity_id: Any hashable id (slot index, object)
+            left: Left edge of the hitbox
+            width: Hitbox width
+        """
+        span = self._span(left, width)
+        self._spans[entity_id] = span
+        for column in range(span[0], span[1] + 1):
+            self.buckets.setdefault(column, set()).add(entity_id)
+
+    def remove(self, entity_id: Hashable):
+        """
+        Remove an entity if present.
+
+        Args:
+            entity_id: Id passed to insert
+        """
+        span = self._spans.pop(entity_id, None)
+        if span is None:
+            return
+        for column in range(span[0], span[1] + 1):
+            bucket = self.buckets[column]
+            bucket.discard(entity_id)
+            if not bucket:
+                del self.buckets[column]
+
+    def move(self, entity_id: Hashable, left: float, width: float):
+        """
+        Update an entity's position, touching buckets only if its columns changed.
+
+        Args:
+            entity_id: Id passed to insert
+            left: New left edge of the hitbox
+            width: Hitbox width
+        """
+        if self._spans.get(entity_id) != self._span(left, width):
+            self.remove(entity_id)
+            self.insert(entity_id, left, width)
+
+    def rename(self, old_id: Hashable, new_id: Hashable):
+        """
+        Re-key an entity in place (e.g. after a slot moved in a packed array).
+
+        Args:
+            old_id: Current id
+            new_id: Id to use from now on
+        """
+        span = self._spans.pop(old_id)
+        self._spans[new_id] = span
+        for column in range(span[0], span[1] + 1):
+            bucket = self.buckets[column]
+            bucket.discard(old_id)
+            bucket.add(new_id)
+
+    def query(self, left: float, width: float) -> Set[Hashable]:
+        """
+        Get entities sharing a column with [left, left + width).
+
+        Args:
+            left: Left edge of the query box
+            width: Query box width
+
+        Returns:
+            Set of candidate ids for narrow-phase testing
+        """
+        first, last = self._span(left, width)
+        found: Set[Hashable] = set()
+        for column in range(first, last + 1):
+            bucket = self.buckets.get(column)
+            if bucket:
+                found |= bucket
+        return found
+
+    def clear(self):
+        """Remove all entities."""
+        self.buckets.clear()
+        self._spans.clear()
+
+    def __len__(self) -> int:
+        return len(self._spans)
@@ -1,31 +1,35 @@
 """
 Progressive difficulty scaling system.
 """
+import math
 import random
 from ..config import constants as C
+from .spawn_scheduler import SpawnScheduler
 
 
 class DifficultyManager:
     """Manages difficulty progression during gameplay."""
 
-    def __init__(self, initial_difficulty: str = 'medium'):
+    def __init__(self, initial_difficulty: str = 'medium', rng: random.Random = None,
+                 start_time: float = 0.0):
         """
         Initialize difficulty manager.
 
         Args:
             initial_difficulty: 'easy', 'medium', or 'hard'
+            rng: Random source for spawn timing, the global random module if not provided
+            start_time: Game time to start at, e.g. to jump straight to late-game load
         """
         self.difficulty_name = initial_difficulty
         self.settings = self._get_difficulty_settings(initial_difficulty)
 
-        # Current values (will change during game)
-        self.spawn_rate = self.settings['spawn_rate']
-        self.fall_speed = self.settings['fall_speed']
+        # Current values (follow the curve as time advances)
+        self.time_elapsed = start_time
+        self.spawn_rate = self.spawn_rate_at(start_time)
+        self.fall_speed = self.fall_speed_at(start_time)
 
-        # Progression timers
-        self.time_elapsed = 0.0
-        self.last_spawn_increase = 0.0
-        self.last_speed_increase = 0.0
+        # Meteorite spawn times, drawn from the spawn rate curve
+        self.spawner = SpawnScheduler(self.spawns_per_second, rng, start=start_time)
 
     def _get_difficulty_settings(self, difficulty: str) -> dict:
         """
@@ -52,27 +56,67 @@ class DifficultyManager:
             dt: Delta time in seconds
         """
         self.time_elapsed += dt
+        self.spawn_rate = self.spawn_rate_at(self.time_elapsed)
+        self.fall_speed = self.fall_speed_at(self.time_elapsed)
 
-        # Increase spawn rate every second
-        if self.time_elapsed - self.last_spawn_increase >= 1.0:
-            self.last_spawn_increase = self.time_elapsed
-            self.spawn_rate *= self.settings['spawn_increase_rate']
-            self.spawn_rate = max(5, self.spawn_rate)  # Minimum spawn rate
+    def spawn_rate_at(self, t: float) -> float:
+        """
+        Get the spawn rate setting at a game time.
+
+        Spawn rate is multiplied by spawn_increase_rate every full second,
+        down to MIN_SPAWN_RATE.
 
-        # Increase fall speed every 10 seconds
-        if self.time_elapsed - self.last_speed_increase >= 10.0:
-            self.last_speed_increase = self.time_elapsed
-            self.fall_speed -= self.settings['speed_increase_rate']
-            self.fall_speed = max(-20, self.fall_speed)  # Maximum fall speed
+        Args:
+            t: Game time in seconds
 
-    def should_spawn_meteorite(self) -> bool:
+        Returns:
+            Spawn rate ("one in N frames at 60 FPS")
+        """
+        rate = self.settings['spawn_rate'] * self.settings['spawn_increase_rate'] ** math.floor(t)
+        return max(C.MIN_SPAWN_RATE, rate)
+
+    def fall_speed_at(self, t: float) -> float:
+        """
+        Get the meteorite fall speed at a game time.
+
+        Fall speed grows by speed_increase_rate every full 10 seconds, up to
+        MAX_METEORITE_FALL_SPEED.
+
+        Args:
+            t: Game time in seconds
+
+        Returns:
+            Fall speed (negative number)
         """
-        Check if a meteorite should spawn this frame.
+        speed = self.settings['fall_speed'] - self.settings['speed_increase_rate'] * math.floor(t / 10)
+        return max(C.MAX_METEORITE_FALL_SPEED, speed)
+
+    def spawns_per_second(self, t: float) -> float:
+        """
+        Get the expected number of meteorite spawns per second at a game time.
+
+        Args:
+            t: Game time in seconds
+
+        Returns:
+            Poisson rate of the spawn process
+        """
+        return 60.0 / max(1, int(self.spawn_rate_at(t)))
+
+    def meteorites_due(self, now: float) -> int:
+        """
+        Get how many meteorites should spawn by now.
+
+        Spawn times follow a Poisson process in game time, so density does
+        not depend on frame or tick rate.
+
+        Args:
+            now: Game time in seconds
 
         Returns:
-            True if meteorite should spawn
+            Number of meteorites to spawn this step
         """
-        return random.randint(1, max(1, int(self.spawn_rate))) == 1
+        return self.spawner.due(now)
 
     def get_meteorite_speed(self) -> float:
         """
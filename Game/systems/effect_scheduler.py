@@ -0,0 +1,121 @@
+"""
+Timed effects (power-ups) expiring on simulation time.
+"""
+import heapq
+import itertools
+from typing import Callable, Dict, Hashable, List, Tuple
+
+
+class EffectScheduler:
+    """
+    Tracks active timed effects in a min-heap keyed by expiry time.
+
+    Each effect kind (e.g. a PowerUpType) registers apply/expire callbacks
+    once. Activating an effect that is already running only pushes its expiry
+    back; the stale heap entry is skipped when it surfaces. Checking for
+    expiries each tick only peeks at the heap top.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Hashable, Tuple[Callable[[], None], Callable[[], None]]] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []  # (expires_at, seq, effect)
+        self._active: Dict[Hashable, Tuple[float, int]] = {}  # effect -> (expires_at, seq)
+        self._seq = itertools.count()
+
+    def register(self, effect: Hashable, apply: Callable[[], None], expire: Callable[[], None]):
+        """
+        Set the callbacks for an effect kind.
+
+        Args:
+            effect: Effect key
+            apply: Called when the effect starts
+            expire: Called when the effect ends (timed out or cancelled)
+        """
+        self._handlers[effect] = (apply, expire)
+
+    def activate(self, effect: Hashable, now: float, duration: float):
+        """
+        Start an effect, or extend it if it is already active.
+
+        Args:
+            effect: Registered effect key
+            now: Current simulation time in seconds
+            duration: Effect duration in seconds
+        """
+        seq = next(self._seq)
+        expires_at = now + duration
+        was_active = effect in self._active
+
+        self._active[effect] = (expires_at, seq)
+        heapq.heappush(self._heap, (expires_at, seq, effect))
+
+        if not was_active:
+            self._handlers[effect][0]()
+
+    def cancel(self, effect: Hashable) -> bool:
+        """
+        End an effect early, running its expire callback.
+
+        Args:
+            effect: Effect key
+
+        Returns:
+            True if the effect was active
+        """
+        if self._active.pop(effect, None) is None:
+            return False
+        self._handlers[effect][1]()
+        return True
+
+    def update(self, now: float) -> List[Hashable]:
+        """
+        Expire every effect whose time is up.
+
+        Args:
+            now: Current simulation time in seconds
+
+        Returns:
+            Effects that expired, in expiry order
+        """
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expires_at, seq, effect = heapq.heappop(heap)
+            if self._active.get(effect) != (expires_at, seq):
+                continue  # Extended or cancelled since this entry was pushed
+            del self._active[effect]
+            self._handlers[effect][1]()
+            expired.append(effect)
+        return expired
+
+    def is_active(self, effect: Hashable) -> bool:
+        """Check if an effect is running."""
+        return effect in self._active
+
+    def remaining(self, effect: Hashable, now: float) -> float:
+        """
+        Get time left on an effect.
+
+        Args:
+            effect: Effect key
+            now: Current simulation time in seconds
+
+        Returns:
+            Seconds until expiry, 0 if not active
+        """
+        entry = self._active.get(effect)
+        return max(0.0, entry[0] - now) if entry else 0.0
+
+    def active(self) -> List[Hashable]:
+        """
+        Get running effects.
+
+        Returns:
+            Effect keys in activation order
+        """
+        return list(self._active)
+
+    def clear(self):
+        """Drop all effects without running expire callbacks."""
+        self._heap.clear()
+        self._active.clear()
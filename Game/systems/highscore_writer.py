@@ -0,0 +1,131 @@
+"""
+Background, atomic persistence for the high score table.
+"""
+import atexit
+import contextlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+def _read_umask() -> int:
+    """Read the process umask (os.umask can only read it by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode for a newly created high score file. The umask is process-wide, so it is
+# read once here, on the importing thread, and never touched by the writer thread.
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+
+class HighScoreWriter:
+    """
+    Singleton background writer for JSON files.
+
+    Saves are handed off to one worker thread so the game loop never waits
+    on disk. Only the newest pending document per path is written, so a burst
+    of saves collapses into one write. Each write goes to a temp file in the
+    same directory, is fsynced, and then atomically replaces the target, so a
+    crash mid-write leaves the previous file intact.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self._pending: Dict[str, dict] = {}  # path -> newest document
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+        self.coalesced = 0
+
+        atexit.register(self.flush)
+
+    def submit(self, path: str, document: dict):
+        """
+        Queue a document to be written, replacing any unwritten one for the same path.
+
+        Args:
+            path: Destination file
+            document: JSON-serializable data, must not be mutated afterwards
+        """
+        with self._condition:
+            if path in self._pending:
+                self.coalesced += 1
+            self._pending[path] = document
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='HighScoreWriter', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every queued document is on disk.
+
+        Args:
+            timeout: Seconds to wait at most, None to wait forever
+
+        Returns:
+            True if nothing is left to write
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        """Worker loop: write the newest document per path, one at a time."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                path, document = self._pending.popitem()
+                self._busy = True
+
+            try:
+                _write_atomic(path, document)
+                self.writes += 1
+            except (OSError, TypeError, ValueError) as e:
+                print(f"ERROR: Could not save high scores: {e}")
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+def _write_atomic(path: str, document: dict):
+    """Write JSON to a temp file next to path, fsync it, then rename over path."""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix='.highscores-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(document, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, _file_mode(path))  # mkstemp creates 0600
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+def _file_mode(path: str) -> int:
+    """Permission bits of the existing file, or the umask default for a new one."""
+    try:
+        return os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
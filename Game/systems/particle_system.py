@@ -2,72 +2,156 @@
 Particle effects for jumps, collisions, and meteorite trails.
 """
 import pygame
-import random
-from typing import List
+import numpy as np
+from enum import IntEnum
+from typing import Union
 from ..config import constants as C
+from ..core.effect_cache import EffectCache
 
+# Per-slot arrays, one entry per particle
+_FIELDS = (
+    ('x', np.float64),
+    ('y', np.float64),
+    ('vel_x', np.float64),
+    ('vel_y', np.float64),
+    ('lifetime', np.float64),
+    ('max_lifetime', np.float64),
+    ('size', np.int16),
+    ('priority', np.int8),
+)
 
-class Particle:
-    """Single particle with lifetime."""
+ArrayLike = Union[float, np.ndarray]
 
-    def __init__(self, x: int, y: int, color: tuple, vel_x: float, vel_y: float, lifetime: float):
+
+class ParticlePriority(IntEnum):
+    """Emitter priorities - at the budget, higher ones evict lower ones."""
+    TRAIL = 0
+    JUMP = 1
+    POWERUP = 2
+    COLLISION = 3
+
+
+class ParticleSystem:
+    """
+    Manages all particle effects as a fixed-capacity structure of arrays.
+
+    Slots [0, count) are live, oldest first. Integration, gravity and lifetime
+    run as vectorised operations, and dead slots are compacted away after each
+    update. Once the budget is reached, new particles recycle the slots of
+    the oldest ones of lower or equal priority, like a ring buffer, so a
+    collision burst always shows up even when the pool is full of trails.
+    A level-of-detail governor thins trail emission while frames run long.
+    """
+
+    def __init__(self, capacity: int = C.PARTICLE_CAPACITY, budget: int = C.PARTICLE_BUDGET,
+                 rng: np.random.Generator = None):
         """
-        Initialize a particle.
+        Initialize particle system.
 
         Args:
-            x: Initial X position
-            y: Initial Y position
-            color: RGB color tuple
-            vel_x: X velocity
-            vel_y: Y velocity
-            lifetime: Lifetime in seconds
+            capacity: Number of particle slots allocated up front
+            budget: Maximum number of live particles (at most capacity)
+            rng: Random source, an unseeded generator if not provided
         """
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2(vel_x, vel_y)
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
+        self.capacity = capacity
+        self.budget = min(budget, capacity)
+        self.count = 0
+        for name, dtype in _FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.trail_density = 1.0  # Fraction of trail particles emitted, set by govern()
 
-    def update(self, dt: float) -> bool:
+        # Statistics
+        self.dropped = 0
+        self.evicted = 0
+        self.last_batch = 0  # Sprites blitted by the last draw
+
+    def _emit(self, n: int, priority: ParticlePriority, x: ArrayLike, y: ArrayLike,
+              color: ArrayLike, vel_x: ArrayLike, vel_y: ArrayLike, lifetime: ArrayLike) -> int:
         """
-        Update particle, return True if alive.
+        Append a batch of particles, evicting older ones if over budget.
 
         Args:
-            dt: Delta time in seconds
+            n: Number of particles
+            priority: Emitter priority
+            x: X positions (scalar or array of n)
+            y: Y positions (scalar or array of n)
+            color: RGB color, or (n, 3) array of colors
+            vel_x: X velocities
+            vel_y: Y velocities
+            lifetime: Lifetimes in seconds
 
         Returns:
-            True if particle is still alive
+            Number of particles actually emitted
         """
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            return False
+        over = self.count + n - self.budget
+        if over > 0:
+            self._evict(over, priority)
 
-        self.pos += self.vel * dt * 60
-        self.vel.y += 0.2  # Gravity
-        return True
+        start = self.count
+        n_fit = min(n, self.budget - start)
+        self.dropped += n - n_fit
+        if n_fit <= 0:
+            return 0
 
-    def draw(self, screen: pygame.Surface):
+        end = start + n_fit
+        batch = slice(start, end)
+        for name, value in (('x', x), ('y', y), ('vel_x', vel_x), ('vel_y', vel_y),
+                            ('lifetime', lifetime), ('max_lifetime', lifetime)):
+            getattr(self, name)[batch] = np.broadcast_to(value, (n,))[:n_fit]
+        self.color[batch] = np.broadcast_to(np.asarray(color, dtype=np.uint8), (n, 3))[:n_fit]
+        self.size[batch] = self.rng.integers(2, 6, n_fit)
+        self.priority[batch] = priority
+
+        self.count = end
+        return n_fit
+
+    def _evict(self, n: int, priority: ParticlePriority):
         """
-        Draw particle with fade-out.
+        Free up to n slots, taking the lowest priority first and the oldest within it.
 
         Args:
-            screen: Pygame surface to draw on
+            n: Number of slots wanted
+            priority: Highest priority that may be evicted
         """
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        alpha = max(0, min(255, alpha))  # Clamp to 0-255
-        color_with_alpha = (*self.color[:3], alpha)
+        live = self.priority[:self.count]
+        candidates = np.flatnonzero(live <= priority)
+        if candidates.size > n:
+            # Slots are in emission order, so a stable sort by priority keeps oldest first
+            order = np.argsort(live[candidates], kind='stable')
+            candidates = candidates[order[:n]]
+        if candidates.size == 0:
+            return
 
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-        screen.blit(surf, (int(self.pos.x) - self.size, int(self.pos.y) - self.size))
+        keep = np.ones(self.count, dtype=bool)
+        keep[candidates] = False
+        self._compact(np.flatnonzero(keep))
+        self.evicted += candidates.size
 
+    def _compact(self, alive: np.ndarray):
+        """Move the given slots (in order) to the front and drop the rest."""
+        k = alive.size
+        for name, _ in _FIELDS:
+            array = getattr(self, name)
+            array[:k] = array[alive]
+        self.color[:k] = self.color[alive]
+        self.count = k
 
-class ParticleSystem:
-    """Manages all particle effects."""
+    def govern(self, frame_time: float):
+        """
+        Adjust trail density from the last frame's work time.
+
+        Backs off quickly while frames are over budget and recovers slowly
+        once there is headroom.
 
-    def __init__(self):
-        self.particles: List[Particle] = []
+        Args:
+            frame_time: Seconds spent on the last frame (excluding the frame cap wait)
+        """
+        if frame_time > C.PARTICLE_FRAME_BUDGET:
+            self.trail_density = max(C.PARTICLE_MIN_TRAIL_DENSITY, self.trail_density * 0.85)
+        elif frame_time < C.PARTICLE_FRAME_BUDGET * 0.8:
+            self.trail_density = min(1.0, self.trail_density + 0.02)
 
     def emit_jump(self, x: int, y: int):
         """
@@ -77,16 +161,14 @@ class ParticleSystem:
             x: Player X position
             y: Player Y position
         """
-        for _ in range(10):
-            particle = Particle(
-                x + random.randint(-20, 20),
-                y + C.PLAYER_SIZE,
-                (200, 200, 200),
-                random.uniform(-2, 2),
-                random.uniform(-1, 1),
-                random.uniform(0.2, 0.5)
-            )
-            self.particles.append(particle)
+        n, rng = 10, self.rng
+        self._emit(n, ParticlePriority.JUMP,
+                   x + rng.integers(-20, 21, n),
+                   y + C.PLAYER_SIZE,
+                   (200, 200, 200),
+                   rng.uniform(-2, 2, n),
+                   rng.uniform(-1, 1, n),
+                   rng.uniform(0.2, 0.5, n))
 
     def emit_collision(self, x: int, y: int):
         """
@@ -96,16 +178,15 @@ class ParticleSystem:
             x: Collision X position
             y: Collision Y position
         """
-        for _ in range(30):
-            particle = Particle(
-                x,
-                y,
-                (255, random.randint(100, 200), 0),
-                random.uniform(-5, 5),
-                random.uniform(-8, -2),
-                random.uniform(0.5, 1.5)
-            )
-            self.particles.append(particle)
+        n, rng = 30, self.rng
+        colors = np.empty((n, 3), dtype=np.uint8)
+        colors[:, 0] = 255
+        colors[:, 1] = rng.integers(100, 201, n)
+        colors[:, 2] = 0
+        self._emit(n, ParticlePriority.COLLISION, x, y, colors,
+                   rng.uniform(-5, 5, n),
+                   rng.uniform(-8, -2, n),
+                   rng.uniform(0.5, 1.5, n))
 
     def emit_meteorite_trail(self, x: int, y: int):
         """
@@ -115,15 +196,41 @@ class ParticleSystem:
             x: Meteorite X position
             y: Meteorite Y position
         """
-        particle = Particle(
-            x + C.METEORITE_SIZE // 2 + random.randint(-5, 5),
-            y + C.METEORITE_SIZE // 2 + random.randint(-5, 5),
-            (255, random.randint(150, 200), 0),
-            random.uniform(-0.5, 0.5),
-            random.uniform(-1, 1),
-            random.uniform(0.3, 0.8)
-        )
-        self.particles.append(particle)
+        self.emit_meteorite_trails(np.array([x], dtype=np.float64), np.array([y], dtype=np.float64))
+
+    def emit_meteorite_trails(self, xs: np.ndarray, ys: np.ndarray, dt: float = 1.0 / 60):
+        """
+        Emit trail particles behind many falling meteorites.
+
+        Trails are tuned as one particle per meteorite per 60 FPS frame, so
+        shorter steps emit proportionally fewer, and under load only a
+        trail_density fraction of those emit.
+
+        Args:
+            xs: Meteorite X positions
+            ys: Meteorite Y positions
+            dt: Delta time in seconds covered by this emission
+        """
+        rng = self.rng
+        chance = self.trail_density * min(1.0, dt * 60)
+        if chance < 1.0:
+            kept = rng.random(len(xs)) < chance
+            xs, ys = xs[kept], ys[kept]
+        n = len(xs)
+        if n == 0:
+            return
+        half = C.METEORITE_SIZE // 2
+        colors = np.empty((n, 3), dtype=np.uint8)
+        colors[:, 0] = 255
+        colors[:, 1] = rng.integers(150, 201, n)
+        colors[:, 2] = 0
+        self._emit(n, ParticlePriority.TRAIL,
+                   np.asarray(xs, dtype=np.int64) + half + rng.integers(-5, 6, n),
+                   np.asarray(ys, dtype=np.int64) + half + rng.integers(-5, 6, n),
+                   colors,
+                   rng.uniform(-0.5, 0.5, n),
+                   rng.uniform(-1, 1, n),
+                   rng.uniform(0.3, 0.8, n))
 
     def emit_powerup_collect(self, x: int, y: int, color: tuple = (255, 255, 100)):
         """
@@ -134,36 +241,76 @@ class ParticleSystem:
             y: Power-up Y position
             color: Particle color
         """
-        for _ in range(20):
-            particle = Particle(
-                x,
-                y,
-                color,
-                random.uniform(-4, 4),
-                random.uniform(-6, -1),
-                random.uniform(0.4, 1.0)
-            )
-            self.particles.append(particle)
+        n, rng = 20, self.rng
+        self._emit(n, ParticlePriority.POWERUP, x, y, color[:3],
+                   rng.uniform(-4, 4, n),
+                   rng.uniform(-6, -1, n),
+                   rng.uniform(0.4, 1.0, n))
 
     def update(self, dt: float):
         """
-        Update all particles and remove dead ones.
+        Update all particles and compact out dead ones.
 
         Args:
             dt: Delta time in seconds
         """
-        self.particles = [p for p in self.particles if p.update(dt)]
+        n = self.count
+        if n == 0:
+            return
+
+        self.lifetime[:n] -= dt
+        alive = np.flatnonzero(self.lifetime[:n] > 0)
+        if alive.size < n:
+            self._compact(alive)
+            n = self.count
+
+        self.x[:n] += self.vel_x[:n] * (dt * 60)
+        self.y[:n] += self.vel_y[:n] * (dt * 60)
+        self.vel_y[:n] += 0.2 * dt * 60  # Gravity
 
     def clear(self):
         """Remove all particles."""
-        self.particles.clear()
+        self.count = 0
 
-    def draw(self, screen: pygame.Surface):
+    def __len__(self) -> int:
+        return self.count
+
+    def draw(self, screen: pygame.Surface) -> list:
         """
-        Draw all particles.
+        Draw all particles with fade-out, in a single batched blit.
+
+        Each particle is drawn with a shared sprite for its (size, color bucket,
+        alpha bucket), so no surfaces are created in steady state.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self.count
+        self.last_batch = n
+        if n == 0:
+            return []
+
+        # Bucket alpha and color, then pack each sprite key into one integer
+        levels = C.PARTICLE_ALPHA_LEVELS - 1
+        fade = np.clip(self.lifetime[:n] / self.max_lifetime[:n], 0.0, 1.0)
+        alpha = (np.rint(fade * levels) * 255 // levels).astype(np.int64)
+        step = C.PARTICLE_COLOR_STEP
+        color = np.minimum(np.rint(self.color[:n] / step) * step, 255).astype(np.int64)
+        size = self.size[:n].astype(np.int64)
+        keys = (((size * 256 + color[:, 0]) * 256 + color[:, 1]) * 256 + color[:, 2]) * 256 + alpha
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        bank = EffectCache()
+        sprites = []
+        for key in unique_keys.tolist():
+            key, a = divmod(key, 256)
+            key, b = divmod(key, 256)
+            s, r_g = divmod(key, 65536)
+            sprites.append(bank.particle_disc(s, (r_g >> 8, r_g & 255, b), a))
+
+        left = (self.x[:n].astype(np.int64) - size).tolist()
+        top = (self.y[:n].astype(np.int64) - size).tolist()
+        return screen.blits([(sprites[i], (x, y)) for i, x, y in zip(inverse.tolist(), left, top, strict=True)])
@@ -2,136 +2,63 @@
 Physics system for ragdoll and particles.
 """
 import pygame
-import random
-from typing import List
+import numpy as np
 from ..config import constants as C
+from ..core.effect_cache import EffectCache
 
 
-class RagdollLimb:
-    """Individual limb with physics."""
+SKIN = (255, 220, 177)
+BLUE = (100, 100, 255)
 
-    def __init__(self, x: int, y: int, width: int, height: int, color: tuple):
-        """
-        Initialize a ragdoll limb.
-
-        Args:
-            x: Initial X position
-            y: Initial Y position
-            width: Limb width
-            height: Limb height
-            color: RGB color tuple
-        """
-        self.pos = pygame.math.Vector2(x, y)
-        self.vel = pygame.math.Vector2(
-            random.uniform(-5, 5),
-            random.uniform(-10, -5)
-        )
-        self.angular_vel = random.uniform(-20, 20)
-        self.angle = 0
-        self.width = width
-        self.height = height
-        self.color = color
-        self.grounded = False
-
-    def update(self, dt: float):
-        """
-        Update limb physics.
-
-        Args:
-            dt: Delta time in seconds
-        """
-        if not self.grounded:
-            # Gravity
-            self.vel.y += C.GRAVITY * dt * 60
-
-            # Update position
-            self.pos += self.vel * dt * 60
-
-            # Rotation
-            self.angle += self.angular_vel * dt * 10
-
-            # Ground collision
-            if self.pos.y >= C.GROUND_LEVEL:
-                self.pos.y = C.GROUND_LEVEL
-                self.vel.y *= -0.3  # Bounce
-                self.vel.x *= 0.8  # Friction
-                self.angular_vel *= 0.8
-
-                if abs(self.vel.y) < 1 and abs(self.vel.x) < 0.5:
-                    self.grounded = True
-                    self.vel.x = 0
-                    self.vel.y = 0
-
-    def draw(self, screen: pygame.Surface):
-        """
-        Draw rotated rectangle.
-
-        Args:
-            screen: Pygame surface to draw on
-        """
-        surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        surf.fill(self.color)
-        rotated = pygame.transform.rotate(surf, self.angle)
-        rect = rotated.get_rect(center=(int(self.pos.x), int(self.pos.y)))
-        screen.blit(rotated, rect)
+# Limb layout of one body: (offset x, offset y, width, height, color) from the player's top left
+LIMBS = (
+    (25, 10, 20, 20, SKIN),   # Head
+    (25, 35, 15, 30, BLUE),   # Body (blue shirt)
+    (15, 30, 8, 20, SKIN),    # Left arm
+    (35, 30, 8, 20, SKIN),    # Right arm
+    (20, 55, 8, 25, BLUE),    # Left leg (blue pants)
+    (30, 55, 8, 25, BLUE),    # Right leg
+)
 
 
 class Ragdoll:
-    """Ragdoll death animation."""
+    """
+    Ragdoll death animation for one or many bodies.
 
-    def __init__(self, player_x: int, player_y: int):
+    Every limb of every body is a row in a set of NumPy arrays, so gravity,
+    bouncing and settling run as whole-array operations. Limbs are drawn from
+    pre-rotated frames at fixed angle steps, batched into one blits call.
+    """
+
+    def __init__(self, player_x: int, player_y: int, count: int = C.RAGDOLL_COUNT,
+                 rng: np.random.Generator = None):
         """
         Initialize ragdoll at player position.
 
         Args:
             player_x: Player X position
             player_y: Player Y position
+            count: Number of bodies to throw (capped at RAGDOLL_MAX_COUNT)
+            rng: Random source, an unseeded generator if not provided
         """
-        self.limbs: List[RagdollLimb] = []
+        self.count = max(1, min(count, C.RAGDOLL_MAX_COUNT))
         self.finished = False
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        n = self.count * len(LIMBS)
+        self.limb = np.tile(np.arange(len(LIMBS)), self.count)
+        offset_x = np.array([limb[0] for limb in LIMBS], dtype=np.float64)
+        offset_y = np.array([limb[1] for limb in LIMBS], dtype=np.float64)
+
+        self.x = player_x + offset_x[self.limb]
+        self.y = player_y + offset_y[self.limb]
+        self.vel_x = self.rng.uniform(-5, 5, n)
+        self.vel_y = self.rng.uniform(-10, -5, n)
+        self.angle = np.zeros(n)
+        self.angular_vel = self.rng.uniform(-20, 20, n)
+        self.grounded = np.zeros(n, dtype=bool)
 
-        # Create limbs (simplified character)
-        # Head
-        self.limbs.append(RagdollLimb(
-            player_x + 25, player_y + 10,
-            20, 20,
-            (255, 220, 177)  # Skin color
-        ))
-
-        # Body
-        self.limbs.append(RagdollLimb(
-            player_x + 25, player_y + 35,
-            15, 30,
-            (100, 100, 255)  # Blue shirt
-        ))
-
-        # Left arm
-        self.limbs.append(RagdollLimb(
-            player_x + 15, player_y + 30,
-            8, 20,
-            (255, 220, 177)  # Skin color
-        ))
-
-        # Right arm
-        self.limbs.append(RagdollLimb(
-            player_x + 35, player_y + 30,
-            8, 20,
-            (255, 220, 177)  # Skin color
-        ))
-
-        # Left leg
-        self.limbs.append(RagdollLimb(
-            player_x + 20, player_y + 55,
-            8, 25,
-            (100, 100, 255)  # Blue pants
-        ))
-
-        # Right leg
-        self.limbs.append(RagdollLimb(
-            player_x + 30, player_y + 55,
-            8, 25,
-            (100, 100, 255)  # Blue pants
-        ))
+        self._frames = None
 
     def update(self, dt: float):
         """
@@ -140,21 +67,50 @@ class Ragdoll:
         Args:
             dt: Delta time in seconds
         """
-        all_grounded = True
-        for limb in self.limbs:
-            limb.update(dt)
-            if not limb.grounded:
-                all_grounded = False
-
-        if all_grounded:
-            self.finished = True
-
-    def draw(self, screen: pygame.Surface):
+        moving = ~self.grounded
+        step = dt * 60
+
+        # Gravity, then position and rotation
+        self.vel_y[moving] += C.GRAVITY * step
+        self.x[moving] += self.vel_x[moving] * step
+        self.y[moving] += self.vel_y[moving] * step
+        self.angle[moving] += self.angular_vel[moving] * dt * 10
+
+        # Ground collision
+        hit = moving & (self.y >= C.GROUND_LEVEL)
+        self.y[hit] = C.GROUND_LEVEL
+        self.vel_y[hit] *= -0.3  # Bounce
+        self.vel_x[hit] *= 0.8  # Friction
+        self.angular_vel[hit] *= 0.8
+
+        settled = hit & (np.abs(self.vel_y) < 1) & (np.abs(self.vel_x) < 0.5)
+        self.grounded |= settled
+        self.vel_x[settled] = 0
+        self.vel_y[settled] = 0
+
+        self.finished = bool(self.grounded.all())
+
+    def draw(self, screen: pygame.Surface) -> list:
         """
         Draw all limbs.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
-        for limb in self.limbs:
-            limb.draw(screen)
+        if self._frames is None:
+            effects = EffectCache()
+            self._frames = [effects.rotated_rects(w, h, color) for _, _, w, h, color in LIMBS]
+
+        steps = C.RAGDOLL_ROTATION_STEPS
+        frame_index = np.rint(self.angle * steps / 360.0).astype(np.int64) % steps
+        frames = self._frames
+
+        blits = []
+        for limb, frame, x, y in zip(self.limb.tolist(), frame_index.tolist(),
+                                     self.x.astype(np.int64).tolist(), self.y.astype(np.int64).tolist(), strict=True):
+            image = frames[limb][frame]
+            blits.append((image, (x - image.get_width() // 2, y - image.get_height() // 2)))
+        return screen.blits(blits)
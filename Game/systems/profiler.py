@@ -0,0 +1,186 @@
+"""
+Per-phase frame profiler with rolling percentiles and on-screen overlay.
+"""
+import json
+import os
+import time
+import pygame
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional
+from ..config import constants as C
+from ..core.font_manager import FontManager
+
+
+class FrameProfiler:
+    """Times named phases of each frame and keeps a rolling window of samples."""
+
+    def __init__(self, window: int = C.PROFILER_WINDOW):
+        """
+        Initialize profiler.
+
+        Args:
+            window: Number of frames kept for percentile statistics
+        """
+        self.window = window
+        self.samples: Dict[str, Deque[float]] = {}
+        self.counters: Dict[str, float] = {}
+        self.frame_count = 0
+        self.last_frame_time = 0.0  # Seconds of work in the last closed frame
+        self.overlay_visible = False
+
+        self._current: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._stats_cache: Dict[str, tuple] = {}
+        self._stats_frame = -1
+
+    @contextmanager
+    def section(self, name: str):
+        """
+        Time a block of code as a named phase.
+
+        Phases hit several times per frame (e.g. fixed simulation steps) are summed.
+
+        Args:
+            name: Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - start
+
+    def set_counter(self, name: str, value: float):
+        """
+        Record a non-timing value (entity counts, cache sizes) shown in the overlay.
+
+        Args:
+            name: Counter name
+            value: Latest value
+        """
+        self.counters[name] = value
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        self._current.clear()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Close the frame and push its phase timings into the rolling window."""
+        self.last_frame_time = time.perf_counter() - self._frame_start
+        self._current['frame'] = self.last_frame_time
+
+        for name, seconds in self._current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(seconds * 1000.0)
+
+        self.frame_count += 1
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.overlay_visible = not self.overlay_visible
+
+    def get_stats(self) -> Dict[str, tuple]:
+        """
+        Get rolling statistics per phase.
+
+        Returns:
+            Dictionary of phase name -> (p50, p95, p99, max) in milliseconds
+        """
+        # Sorting every window each frame is wasteful, refresh a few times per second
+        if self._stats_frame >= 0 and self.frame_count - self._stats_frame < C.PROFILER_REFRESH_FRAMES:
+            return self._stats_cache
+
+        stats = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            stats[name] = (
+                _percentile(ordered, 50),
+                _percentile(ordered, 95),
+                _percentile(ordered, 99),
+                ordered[-1]
+            )
+
+        self._stats_cache = stats
+        self._stats_frame = self.frame_count
+        return stats
+
+    def report(self) -> dict:
+        """
+        Build a machine-readable summary.
+
+        Returns:
+            Dictionary with window size, frame count, per-phase percentiles and counters
+        """
+        self._stats_frame = -1  # Force a fresh computation
+        phases = {
+            name: {'p50_ms': round(p50, 4), 'p95_ms': round(p95, 4),
+                   'p99_ms': round(p99, 4), 'max_ms': round(worst, 4)}
+            for name, (p50, p95, p99, worst) in self.get_stats().items()
+        }
+        return {
+            'frames': self.frame_count,
+            'window': self.window,
+            'phases': phases,
+            'counters': dict(self.counters)
+        }
+
+    def dump(self, path: str):
+        """
+        Write the report as JSON.
+
+        Args:
+            path: Output file path
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self.report(), f, indent=2)
+            print(f"Profile written to {path}")
+        except OSError as e:
+            print(f"ERROR: Could not write profile: {e}")
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """
+        Draw the overlay if visible.
+
+        Args:
+            screen: Pygame surface to draw on
+
+        Returns:
+            Screen area that was drawn, or None if hidden
+        """
+        if not self.overlay_visible:
+            return None
+
+        font = FontManager().get_font(C.PROFILER_TEXT_SIZE, C.PROFILER_FONT)
+
+        lines = [f"{'phase':<18}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        stats = self.get_stats()
+        for name in sorted(stats, key=lambda n: (n != 'frame', n)):
+            p50, p95, p99, _ = stats[name]
+            lines.append(f"{name:<18}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<18}{value:>7g}")
+
+        # Timings change every refresh, so render directly instead of filling the text cache
+        texts = [font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = font.get_linesize()
+        width = max(text.get_width() for text in texts) + 10
+        panel = pygame.Surface((width, line_height * len(texts) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for i, text in enumerate(texts):
+            panel.blit(text, (5, 5 + i * line_height))
+
+        return screen.blit(panel, (C.SCREEN_WIDTH - panel.get_width() - 10, 40))
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
@@ -3,9 +3,9 @@ Score tracking and high score persistence.
 """
 import json
 import os
-import pygame
 from typing import List, Dict
 from ..config import constants as C
+from .highscore_writer import HighScoreWriter
 
 
 class ScoreManager:
@@ -14,9 +14,9 @@ class ScoreManager:
     def __init__(self):
         self.current_score = 0
         self.score_multiplier = 1.0
-        self.multiplier_end_time = 0
         self.time_elapsed = 0.0
         self.meteorites_dodged = 0
+        self._score_fraction = 0.0  # Time score below one point, carried between updates
         self.high_scores: List[Dict] = []
 
         self._load_high_scores()
@@ -25,9 +25,9 @@ class ScoreManager:
         """Reset current game score."""
         self.current_score = 0
         self.score_multiplier = 1.0
-        self.multiplier_end_time = 0
         self.time_elapsed = 0.0
         self.meteorites_dodged = 0
+        self._score_fraction = 0.0
 
     def update(self, dt: float):
         """
@@ -39,7 +39,9 @@ class ScoreManager:
         self.time_elapsed += dt
 
         # Base score from time
-        score_gain = int(C.SCORE_PER_SECOND * dt * self.score_multiplier)
+        self._score_fraction += C.SCORE_PER_SECOND * dt * self.score_multiplier
+        score_gain = int(self._score_fraction)
+        self._score_fraction -= score_gain
         self.current_score += score_gain
 
     def add_meteorite_dodge(self):
@@ -48,33 +50,41 @@ class ScoreManager:
         self.current_score += bonus
         self.meteorites_dodged += 1
 
-    def set_multiplier(self, multiplier: float, duration_ms: int):
+    def set_multiplier(self, multiplier: float):
         """
-        Set score multiplier for power-up.
+        Set score multiplier (timed by the simulation's effect scheduler).
 
         Args:
-            multiplier: Score multiplier value
-            duration_ms: Duration in milliseconds
+            multiplier: Score multiplier value, 1.0 for none
         """
         self.score_multiplier = multiplier
-        self.multiplier_end_time = pygame.time.get_ticks() + duration_ms
-
-    def check_multiplier_expiry(self):
-        """Check if multiplier has expired."""
-        if self.multiplier_end_time > 0 and pygame.time.get_ticks() >= self.multiplier_end_time:
-            self.score_multiplier = 1.0
-            self.multiplier_end_time = 0
 
     def _load_high_scores(self):
         """Load high scores from JSON file."""
+        self.high_scores = []
+        if not os.path.exists(C.HIGHSCORE_FILE):
+            return
+
         try:
-            if os.path.exists(C.HIGHSCORE_FILE):
-                with open(C.HIGHSCORE_FILE, 'r') as f:
-                    data = json.load(f)
-                    self.high_scores = data.get('scores', [])
-        except Exception as e:
+            with open(C.HIGHSCORE_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
             print(f"WARNING: Could not load high scores: {e}")
-            self.high_scores = []
+            return
+
+        scores = data.get('scores') if isinstance(data, dict) else None
+        if not isinstance(scores, list):
+            print(f"WARNING: Ignoring malformed high score file: {C.HIGHSCORE_FILE}")
+            return
+        self.high_scores = [entry for entry in scores if self._is_valid_entry(entry)]
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        """Check that a loaded entry has every field the game and UI read."""
+        if not isinstance(entry, dict):
+            return False
+        return all(isinstance(entry.get(key), (int, float)) and not isinstance(entry.get(key), bool)
+                   for key in ('score', 'time'))
 
     def save_high_score(self, player_name: str = "Player"):
         """
@@ -94,13 +104,20 @@ class ScoreManager:
         self.high_scores.sort(key=lambda x: x['score'], reverse=True)
         self.high_scores = self.high_scores[:10]  # Keep top 10
 
-        # Save to file
-        try:
-            os.makedirs(os.path.dirname(C.HIGHSCORE_FILE), exist_ok=True)
-            with open(C.HIGHSCORE_FILE, 'w') as f:
-                json.dump({'scores': self.high_scores}, f, indent=2)
-        except Exception as e:
-            print(f"ERROR: Could not save high scores: {e}")
+        # Save to file in the background (atomic, bursts coalesce into one write)
+        HighScoreWriter().submit(C.HIGHSCORE_FILE, {'scores': [dict(entry) for entry in self.high_scores]})
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for pending high score saves to reach disk.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if everything was written
+        """
+        return HighScoreWriter().flush(timeout)
 
     def is_high_score(self) -> bool:
         """
@@ -4,6 +4,7 @@ Game over screen with scores and replay option.
 import pygame
 from ..config import constants as C
 from ..utils import colors
+from ..core.font_manager import FontManager
 from .ui_components import Button
 from ..core.state_manager import GameState
 
@@ -12,8 +13,9 @@ class GameOverScreen:
     """Game over screen."""
 
     def __init__(self):
-        self.title_font = pygame.font.SysFont(None, 48)
-        self.text_font = pygame.font.SysFont(None, 24)
+        self.fonts = FontManager()
+        self.title_size = 48
+        self.text_size = 24
 
         center_x = C.SCREEN_WIDTH // 2 - C.BUTTON_WIDTH // 2
 
@@ -43,7 +45,7 @@ class GameOverScreen:
         return GameState.GAME_OVER
 
     def draw(self, screen: pygame.Surface, score: int, time: int,
-             is_high_score: bool, rank: int, high_scores: list):
+             is_high_score: bool, rank: int, high_scores: list) -> list:
         """
         Draw game over screen.
 
@@ -54,40 +56,47 @@ class GameOverScreen:
             is_high_score: True if this is a high score
             rank: Rank in high scores (1-10)
             high_scores: List of high score entries
+
+        Returns:
+            List of screen areas that were drawn
         """
+        dirty = []
+
         # Title
-        title = self.title_font.render("Game Over", True, colors.red)
+        title = self.fonts.render("Game Over", self.title_size, colors.red)
         title_rect = title.get_rect(center=(C.SCREEN_WIDTH // 2, 100))
-        screen.blit(title, title_rect)
+        dirty.append(screen.blit(title, title_rect))
 
         # Score
-        score_text = self.text_font.render(f"Final Score: {score}", True, colors.white)
+        score_text = self.fonts.render(f"Final Score: {score}", self.text_size, colors.white)
         score_rect = score_text.get_rect(center=(C.SCREEN_WIDTH // 2, 180))
-        screen.blit(score_text, score_rect)
+        dirty.append(screen.blit(score_text, score_rect))
 
         # Time
-        time_text = self.text_font.render(f"Time Survived: {time}s", True, colors.white)
+        time_text = self.fonts.render(f"Time Survived: {time}s", self.text_size, colors.white)
         time_rect = time_text.get_rect(center=(C.SCREEN_WIDTH // 2, 210))
-        screen.blit(time_text, time_rect)
+        dirty.append(screen.blit(time_text, time_rect))
 
         # High score notification
         if is_high_score and rank > 0:
-            hs_text = self.title_font.render(f"NEW HIGH SCORE! Rank #{rank}", True, colors.green)
+            hs_text = self.fonts.render(f"NEW HIGH SCORE! Rank #{rank}", self.title_size, colors.green)
             hs_rect = hs_text.get_rect(center=(C.SCREEN_WIDTH // 2, 260))
-            screen.blit(hs_text, hs_rect)
+            dirty.append(screen.blit(hs_text, hs_rect))
 
         # Buttons
-        self.replay_button.draw(screen)
-        self.menu_button.draw(screen)
+        dirty.append(self.replay_button.draw(screen))
+        dirty.append(self.menu_button.draw(screen))
 
         # High scores list (right side)
         if high_scores:
-            hs_title = self.text_font.render("High Scores", True, colors.white)
-            screen.blit(hs_title, (C.SCREEN_WIDTH - 200, 50))
+            hs_title = self.fonts.render("High Scores", self.text_size, colors.white)
+            dirty.append(screen.blit(hs_title, (C.SCREEN_WIDTH - 200, 50)))
 
             y = 80
             for i, entry in enumerate(high_scores[:5]):
                 text = f"{i+1}. {entry['score']} - {entry['time']}s"
-                hs_text = self.text_font.render(text, True, colors.white)
-                screen.blit(hs_text, (C.SCREEN_WIDTH - 200, y))
+                hs_text = self.fonts.render(text, self.text_size, colors.white)
+                dirty.append(screen.blit(hs_text, (C.SCREEN_WIDTH - 200, y)))
                 y += 25
+
+        return dirty
@@ -2,18 +2,74 @@
 In-game HUD displaying score, time, power-ups.
 """
 import pygame
+from typing import Callable, Dict, Tuple
 from ..config import constants as C
 from ..utils import colors
+from ..core.font_manager import FontManager
 
 
 class HUD:
-    """Heads-up display during gameplay."""
+    """
+    Heads-up display during gameplay.
+
+    Each field keeps its rendered surface and is only rebuilt when its value
+    changes, so a steady-state frame is a handful of blits.
+    """
 
     def __init__(self):
-        self.font = pygame.font.SysFont(None, C.HUD_TEXT_SIZE)
+        self.fonts = FontManager()
+        self._fields: Dict[str, tuple] = {}  # name -> (value, surface, rect)
+        self.rebuilds = 0
+
+    def _field(self, name: str, value,
+               build: Callable[[object], Tuple[pygame.Surface, pygame.Rect]]) -> tuple:
+        """
+        Get a field's retained surface, rebuilding it only if the value changed.
+
+        Args:
+            name: Field name
+            value: Value currently displayed by the field
+            build: Function turning the value into (surface, rect)
+
+        Returns:
+            Tuple of (surface, rect)
+        """
+        field = self._fields.get(name)
+        if field is None or field[0] != value:
+            field = (value, *build(value))
+            self._fields[name] = field
+            self.rebuilds += 1
+        return field[1], field[2]
+
+    def _build_score(self, score: int) -> tuple:
+        text = self.fonts.render(f"Score: {score}", C.HUD_TEXT_SIZE, colors.white)
+        return text, text.get_rect(topleft=(10, 10))
+
+    def _build_time(self, time: int) -> tuple:
+        # FIXED: Now resets properly between games
+        text = self.fonts.render(f"Time: {time}s", C.HUD_TEXT_SIZE, colors.white)
+        return text, text.get_rect(topright=(C.SCREEN_WIDTH - 10, 10))
+
+    def _build_multiplier(self, multiplier: float) -> tuple:
+        text = self.fonts.render(f"x{multiplier:.1f}", C.HUD_TEXT_SIZE, colors.yellow)
+        return text, text.get_rect(topleft=(10, 40))
+
+    def _build_powerups(self, powerups: tuple) -> tuple:
+        """Stack power-up labels upwards from the bottom left into one panel."""
+        labels = [self.fonts.render(p, C.HUD_TEXT_SIZE, colors.green) for p in powerups]
+        top = C.SCREEN_HEIGHT - 40 - 25 * (len(labels) - 1)
+        width = max(label.get_width() for label in labels)
+        height = 25 * (len(labels) - 1) + labels[-1].get_height()
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        y_offset = height - labels[-1].get_height()
+        for label in labels:
+            panel.blit(label, (0, y_offset))
+            y_offset -= 25
+        return panel, panel.get_rect(topleft=(10, top))
 
     def draw(self, screen: pygame.Surface, score: int, time: int,
-             multiplier: float, active_powerups: list):
+             multiplier: float, active_powerups: list) -> list:
         """
         Draw HUD elements.
 
@@ -23,24 +79,22 @@ class HUD:
             time: Time survived in seconds
             multiplier: Score multiplier
             active_powerups: List of active power-up names
-        """
-        # Score (top left)
-        score_text = self.font.render(f"Score: {score}", True, colors.white)
-        screen.blit(score_text, (10, 10))
 
-        # Time (top right) - FIXED: Now resets properly between games
-        time_text = self.font.render(f"Time: {time}s", True, colors.white)
-        time_rect = time_text.get_rect(topright=(C.SCREEN_WIDTH - 10, 10))
-        screen.blit(time_text, time_rect)
+        Returns:
+            List of screen areas that were drawn
+        """
+        # Score (top left), time (top right)
+        fields = [
+            self._field('score', score, self._build_score),
+            self._field('time', time, self._build_time)
+        ]
 
         # Multiplier (if active)
         if multiplier > 1.0:
-            mult_text = self.font.render(f"x{multiplier:.1f}", True, colors.yellow)
-            screen.blit(mult_text, (10, 40))
+            fields.append(self._field('multiplier', multiplier, self._build_multiplier))
 
         # Active power-ups (bottom left)
-        y_offset = C.SCREEN_HEIGHT - 40
-        for powerup in active_powerups:
-            powerup_text = self.font.render(powerup, True, colors.green)
-            screen.blit(powerup_text, (10, y_offset))
-            y_offset -= 25
+        if active_powerups:
+            fields.append(self._field('powerups', tuple(active_powerups), self._build_powerups))
+
+        return [screen.blit(surface, rect) for surface, rect in fields]
@@ -4,6 +4,7 @@ Main menu and difficulty selection.
 import pygame
 from ..config import constants as C
 from ..utils import colors
+from ..core.font_manager import FontManager
 from .ui_components import Button, render_text
 from ..core.state_manager import GameState
 
@@ -12,7 +13,8 @@ class MainMenu:
     """Main menu screen."""
 
     def __init__(self):
-        self.title_font = pygame.font.SysFont(None, C.MENU_TITLE_SIZE)
+        self.fonts = FontManager()
+        self.title_size = C.MENU_TITLE_SIZE
 
         # Buttons centered on screen
         center_x = C.SCREEN_WIDTH // 2 - C.BUTTON_WIDTH // 2
@@ -47,29 +49,34 @@ class MainMenu:
 
         return GameState.MENU
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> list:
         """
         Draw menu.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
         # Title
-        title = self.title_font.render("Dodge Game 2D", True, colors.white)
+        title = self.fonts.render("Dodge Game 2D", self.title_size, colors.white)
         title_rect = title.get_rect(center=(C.SCREEN_WIDTH // 2, 100))
-        screen.blit(title, title_rect)
 
-        # Buttons
-        self.play_button.draw(screen)
-        self.tutorial_button.draw(screen)
-        self.quit_button.draw(screen)
+        return [
+            screen.blit(title, title_rect),
+            self.play_button.draw(screen),
+            self.tutorial_button.draw(screen),
+            self.quit_button.draw(screen)
+        ]
 
 
 class DifficultySelect:
     """Difficulty selection screen."""
 
     def __init__(self):
-        self.title_font = pygame.font.SysFont(None, 36)
+        self.fonts = FontManager()
+        self.title_size = 36
 
         center_x = C.SCREEN_WIDTH // 2 - C.BUTTON_WIDTH // 2
         start_y = 200
@@ -110,18 +117,23 @@ class DifficultySelect:
 
         return (GameState.DIFFICULTY_SELECT, None)
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> list:
         """
         Draw difficulty selection.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
-        title = self.title_font.render("Select Difficulty", True, colors.white)
+        title = self.fonts.render("Select Difficulty", self.title_size, colors.white)
         title_rect = title.get_rect(center=(C.SCREEN_WIDTH // 2, 100))
-        screen.blit(title, title_rect)
 
-        self.easy_button.draw(screen)
-        self.medium_button.draw(screen)
-        self.hard_button.draw(screen)
-        self.back_button.draw(screen)
+        return [
+            screen.blit(title, title_rect),
+            self.easy_button.draw(screen),
+            self.medium_button.draw(screen),
+            self.hard_button.draw(screen),
+            self.back_button.draw(screen)
+        ]
@@ -4,6 +4,7 @@ Tutorial/instructions screen.
 import pygame
 from ..config import constants as C
 from ..utils import colors
+from ..core.font_manager import FontManager
 from .ui_components import Button
 from ..core.state_manager import GameState
 
@@ -12,8 +13,9 @@ class TutorialScreen:
     """Tutorial screen explaining controls."""
 
     def __init__(self):
-        self.title_font = pygame.font.SysFont(None, 36)
-        self.text_font = pygame.font.SysFont(None, 24)
+        self.fonts = FontManager()
+        self.title_size = 36
+        self.text_size = 24
 
         self.back_button = Button("Back", C.SCREEN_WIDTH // 2 - C.BUTTON_WIDTH // 2,
                                  C.SCREEN_HEIGHT - 150)
@@ -35,16 +37,19 @@ class TutorialScreen:
 
         return GameState.TUTORIAL
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> list:
         """
         Draw tutorial.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            List of screen areas that were drawn
         """
         # Title
-        title = self.title_font.render("How to Play", True, colors.white)
-        screen.blit(title, (C.SCREEN_WIDTH // 2 - 100, 50))
+        title = self.fonts.render("How to Play", self.title_size, colors.white)
+        dirty = [screen.blit(title, (C.SCREEN_WIDTH // 2 - 100, 50))]
 
         # Instructions (all in English as per user preference)
         instructions = [
@@ -67,8 +72,9 @@ class TutorialScreen:
 
         y = 120
         for line in instructions:
-            text = self.text_font.render(line, True, colors.white)
-            screen.blit(text, (100, y))
+            text = self.fonts.render(line, self.text_size, colors.white)
+            dirty.append(screen.blit(text, (100, y)))
             y += 30
 
-        self.back_button.draw(screen)
+        dirty.append(self.back_button.draw(screen))
+        return dirty
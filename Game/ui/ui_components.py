@@ -4,6 +4,7 @@ Reusable UI components.
 import pygame
 from ..config import constants as C
 from ..utils import colors
+from ..core.font_manager import FontManager
 
 
 class Button:
@@ -29,7 +30,7 @@ class Button:
         self.hover_color = (255, 100, 100)
         self.text_color = colors.white
 
-        self.font = pygame.font.SysFont(None, C.MENU_TEXT_SIZE)
+        self.fonts = FontManager()
         self.hovered = False
         self.clicked_this_frame = False
 
@@ -60,25 +61,29 @@ class Button:
             self.clicked_this_frame = False
         return False
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
         """
         Draw button.
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            Screen area that was drawn
         """
         color = self.hover_color if self.hovered else self.normal_color
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, colors.white, self.rect, 3)
 
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = self.fonts.render(self.text, C.MENU_TEXT_SIZE, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
+        return self.rect.copy()
 
 
 def render_text(screen: pygame.Surface, text: str, x: int, y: int,
                 font_size: int = 24, color: tuple = (255, 255, 255),
-                center: bool = False):
+                center: bool = False) -> pygame.Rect:
     """
     Render text to screen.
 
@@ -90,11 +95,12 @@ def render_text(screen: pygame.Surface, text: str, x: int, y: int,
         font_size: Font size
         color: RGB color tuple
         center: If True, center text at (x, y)
+
+    Returns:
+        Screen area that was drawn
     """
-    font = pygame.font.SysFont(None, font_size)
-    text_surf = font.render(text, True, color)
+    text_surf = FontManager().render(text, font_size, color)
     if center:
         text_rect = text_surf.get_rect(center=(x, y))
-        screen.blit(text_surf, text_rect)
-    else:
-        screen.blit(text_surf, (x, y))
+        return screen.blit(text_surf, text_rect)
+    return screen.blit(text_surf, (x, y))
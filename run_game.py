@@ -2,9 +2,18 @@
 """
 Launcher script for Dodge Game 2D
 """
-import sys
+import argparse
 from Game.main import DodgeGame
 
 if __name__ == '__main__':
-    game = DodgeGame()
+    parser = argparse.ArgumentParser(description="Dodge Game 2D")
+    parser.add_argument('--profile-dump', metavar='PATH',
+                        help="Write per-phase frame timings as JSON to PATH on exit")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="Only redraw and present screen areas that changed (low-end hardware)")
+    parser.add_argument('--seed', type=int,
+                        help="Seed spawns and effects so every game plays out the same for the same input")
+    args = parser.parse_args()
+
+    game = DodgeGame(profile_dump=args.profile_dump, dirty_rects=args.dirty_rects, seed=args.seed)
     game.run()
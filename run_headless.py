@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Headless runner for Dodge Game 2D - steps the simulation without a window.
+"""
+import argparse
+import time
+import pygame
+from Game.config import constants as C
+from Game.core.random_streams import RandomStreams
+from Game.core.simulation import Simulation
+from Game.systems.physics import Ragdoll
+
+
+def benchmark_ragdolls(count: int, dt: float, seed: int = None):
+    """
+    Time a mass death: many ragdoll bodies updated and drawn off-screen.
+
+    Args:
+        count: Number of ragdoll bodies
+        dt: Seconds per tick
+        seed: Optional seed for the limb velocities
+    """
+    ragdoll = Ragdoll(100, C.GROUND_LEVEL - 100, count, RandomStreams(seed).numpy('cosmetics'))
+    screen = pygame.Surface((C.SCREEN_WIDTH, C.SCREEN_HEIGHT))
+    update_time = draw_time = 0.0
+    ticks = 0
+
+    while not ragdoll.finished and ticks * dt < C.DEATH_ANIMATION_DURATION:
+        start = time.perf_counter()
+        ragdoll.update(dt)
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        ragdoll.draw(screen)
+        draw_time += time.perf_counter() - start
+        ticks += 1
+
+    ticks = max(ticks, 1)
+    print(f"Ragdolls: {ragdoll.count} ({len(ragdoll.limb)} limbs) over {ticks} ticks")
+    print(f"Update: {update_time / ticks * 1000:.3f} ms/tick  Draw: {draw_time / ticks * 1000:.3f} ms/tick")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game simulation without a display")
+    parser.add_argument('--difficulty', choices=['easy', 'medium', 'hard'], default='medium')
+    parser.add_argument('--ticks', type=int, default=60 * C.SIMULATION_HZ, help="Maximum ticks to simulate")
+    parser.add_argument('--dt', type=float, default=1.0 / C.SIMULATION_HZ, help="Seconds per tick")
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help="Fixed steps per tick, e.g. 10 or 100 to fast-forward")
+    parser.add_argument('--start-time', type=float, default=0.0,
+                        help="Game time to start at on the difficulty curve, e.g. 300 for late-game load")
+    parser.add_argument('--seed', type=int, help="Seed for a reproducible run (printed if not given)")
+    parser.add_argument('--ragdolls', type=int, default=0,
+                        help=f"Benchmark this many ragdolls instead (at most {C.RAGDOLL_MAX_COUNT})")
+    args = parser.parse_args()
+
+    if args.ragdolls:
+        benchmark_ragdolls(args.ragdolls, args.dt, args.seed)
+        return
+
+    sim = Simulation(args.difficulty, time_scale=args.time_scale, seed=args.seed,
+                     start_time=args.start_time)
+
+    start = time.perf_counter()
+    ticks = sim.run(args.ticks, args.dt)
+    elapsed = time.perf_counter() - start
+
+    print(f"Ticks: {ticks}  Steps: {sim.ticks} ({sim.ticks / max(elapsed, 1e-9):.0f} steps/s)")
+    print(f"Game time: {sim.time:.1f}s  Game over: {sim.game_over}")
+    print(f"Score: {sim.score_manager.current_score}  Dodged: {sim.score_manager.meteorites_dodged}")
+    print(f"Seed: {sim.rng.seed}")
+
+
+if __name__ == '__main__':
+    main()